@@ -11,10 +11,16 @@ Use cases:
 """
 
 from typing import Dict, List, Any, Optional
+from functools import lru_cache
+import json
+import sys
+import threading
+import numpy as np
 import pulp as pl
+from scipy import sparse
 
 from ..solvers.pulp_solver import PuLPSolver
-from ..solvers.base_solver import ObjectiveSense
+from ..solvers.base_solver import ObjectiveSense, OptimizationStatus
 from ..integration.monte_carlo import MonteCarloIntegration
 from ..integration.data_converters import DataConverter
 
@@ -45,13 +51,14 @@ def optimize_allocation(
                                    "percentile": "p50",  # if mode=percentile
                                    "mc_output": {...}}    # MC simulation result
         solver_options: Optional solver settings:
-                       - {"time_limit": 300, "verbose": False}
+                       - {"time_limit": 300, "verbose": False, "engine": "highs|cbc"}
 
     Returns:
         Dict with:
         - status: "optimal", "infeasible", "unbounded", etc.
         - objective_value: Optimal objective value
         - allocation: Dict of selected quantities per item
+        - selected_items: Names of selected items
         - resource_usage: Dict of resource utilization
         - shadow_prices: Marginal value of each resource
         - monte_carlo_compatible: MC validation-ready output
@@ -77,13 +84,19 @@ def optimize_allocation(
     # Validate inputs
     DataConverter.validate_multi_objective_spec(objective)
     DataConverter.validate_resources_spec(resources)
-    DataConverter.validate_item_requirements(item_requirements, resources)
+    # Validation also yields the sparse (resources × items) requirement matrix
+    requirements = DataConverter.validate_item_requirements(item_requirements, resources)
     DataConverter.validate_item_universe_consistency(objective, item_requirements)
 
+    # Names are looked up over and over below; interned, dict lookups on them
+    # match by identity
+    resources = _intern_names(objective, resources, item_requirements, constraints)
+
     # Extract solver options
     solver_opts = solver_options or {}
     time_limit = solver_opts.get("time_limit", None)
     verbose = solver_opts.get("verbose", False)
+    engine = solver_opts.get("engine", "highs")
 
     # Process Monte Carlo integration if provided (single objective only)
     # For multi-objective, values are processed in _process_multi_objective()
@@ -96,16 +109,17 @@ def optimize_allocation(
         # Multi-objective: create empty dict, values processed later
         item_values = {}
 
-    # Create solver
-    solver = PuLPSolver(problem_name="resource_allocation")
-
-    # Create binary decision variables (select item or not)
-    item_names = [item["name"] for item in item_requirements]
-    variables = solver.create_variables(
-        names=item_names,
-        var_type="binary",  # 0 or 1 selection
-        bounds=None
+    # Model structure (variables, resource and custom constraints) depends only
+    # on the requirements, resources and constraints; repeat calls with the
+    # same structure reuse it and only swap in the new objective
+    model = _get_allocation_model(
+        json.dumps([item_requirements, resources, constraints]),
+        engine
     )
+    solver = model["solver"]
+    variables = model["variables"]
+    item_names = model["item_names"]
+    totals = model["totals"]
 
     # Build objective function (supports multi-objective)
     obj_expr, objective_breakdown = _process_multi_objective(
@@ -119,59 +133,206 @@ def optimize_allocation(
         ObjectiveSense.MAXIMIZE if objective["sense"] == "maximize"
         else ObjectiveSense.MINIMIZE
     )
-    solver.set_objective(obj_expr, sense)
 
-    # Add resource constraints
-    for resource_name, resource_spec in resources.items():
-        total_available = resource_spec["total"]
+    # The cached solver is shared: hold its lock from setting the objective
+    # until the solution has been read
+    with model["lock"]:
+        solver.replace_objective(obj_expr, sense)
+
+        if model["forced_over_capacity"]:
+            # Constraints force selecting an item that alone exceeds a
+            # resource: infeasible without running the solver
+            solver.status = OptimizationStatus.INFEASIBLE
+            solver.solve_time = 0.0
+        else:
+            # Solve
+            try:
+                status = solver.solve(time_limit=time_limit, verbose=verbose)
+            except Exception as e:
+                return {
+                    "status": "error",
+                    "error": str(e),
+                    "message": "Solver encountered an error during optimization"
+                }
+
+        # Build result
+        result = _build_allocation_result(
+            solver,
+            item_names,
+            resources,
+            item_requirements,
+            requirements,
+            totals,
+            model["integral_usage"],
+            model["resource_constraints"],
+            item_values,
+            objective["sense"],
+            objective_breakdown
+        )
+
+        # Add Monte Carlo compatible output for validation
+        if solver.is_feasible():
+            mc_output = _create_mc_compatible_output(
+                result["allocation"],
+                result["selected_items"],
+                item_values,
+                result["objective_value"],
+                objective["sense"]
+            )
+            result["monte_carlo_compatible"] = mc_output
+
+    return result
+
+
+def _intern_names(
+    objective: Dict[str, Any],
+    resources: Dict[str, Dict[str, float]],
+    item_requirements: List[Dict[str, Any]],
+    constraints: Optional[List[Dict[str, Any]]]
+) -> Dict[str, Dict[str, float]]:
+    """
+    Intern item and resource names in place across the allocation inputs.
+
+    Args:
+        objective: Objective specification (single or multi)
+        resources: Resource specifications
+        item_requirements: Item requirements
+        constraints: Optional custom constraints
+
+    Returns:
+        Resources dict keyed by the interned resource names
+    """
+    def intern_name(holder: Dict[str, Any], key: str):
+        value = holder.get(key)
+        if isinstance(value, str):
+            holder[key] = sys.intern(value)
+
+    def intern_list(holder: Dict[str, Any], key: str):
+        values = holder.get(key)
+        if isinstance(values, list):
+            holder[key] = [
+                sys.intern(value) if isinstance(value, str) else value
+                for value in values
+            ]
+
+    for item in item_requirements:
+        intern_name(item, "name")
+
+    for func in objective.get("functions", [objective]):
+        for item in func.get("items", []):
+            intern_name(item, "name")
+
+    for constraint in constraints or []:
+        intern_list(constraint, "items")
+        intern_name(constraint, "condition_item")
+        intern_name(constraint, "then_item")
+
+    return {sys.intern(name): spec for name, spec in resources.items()}
+
+
+@lru_cache(maxsize=8)
+def _get_allocation_model(spec: str, engine: str = "highs") -> Dict[str, Any]:
+    """
+    Build (once per structure) the allocation model without its objective.
+
+    Args:
+        spec: JSON-encoded [item_requirements, resources, constraints]
+        engine: PuLPSolver backend, "highs" or "cbc"
+
+    Returns:
+        Dict with the configured "solver", its "variables", "item_names",
+        resource "totals", "integral_usage" (per resource, whether all item
+        amounts are ints), "resource_constraints" (constraint name to
+        resource name), "forced_over_capacity" (True if the constraints force
+        an item that exceeds a resource on its own) and a "lock" guarding the
+        solver while a call sets its objective and solves
+    """
+    item_requirements, resources, constraints = json.loads(spec)
+
+    # Create solver (HiGHS by default: in-process, avoids CBC launch cost and
+    # is typically faster on larger binary models)
+    solver = PuLPSolver(problem_name="resource_allocation", backend=engine)
+
+    # Create binary decision variables (select item or not)
+    item_names = [sys.intern(item["name"]) for item in item_requirements]
+    variables = solver.create_variables(
+        names=item_names,
+        var_type="binary",  # 0 or 1 selection
+        bounds=None
+    )
+
+    # Placeholder objective creates the problem; each call replaces it
+    solver.set_objective(pl.LpAffineExpression(), ObjectiveSense.MAXIMIZE)
+
+    # Sparse requirement matrix: only the amounts items actually declare
+    resource_names = list(resources.keys())
+    totals = np.fromiter(
+        (resources[r]["total"] for r in resource_names),
+        dtype=np.float64,
+        count=len(resource_names)
+    )
+    requirements = DataConverter.validate_item_requirements(item_requirements, resources)
+
+    # Resources given in int amounts report int usage, as a Python sum would
+    integral_usage = [
+        all(isinstance(item.get(r, 0), int) for item in item_requirements)
+        for r in resource_names
+    ]
+
+    # Add resource constraints (one term per stored nonzero)
+    vars_in_order = list(variables.values())
+    indptr = requirements.indptr.tolist()
+    indices = requirements.indices.tolist()
+    data = requirements.data.tolist()
+    # Loop-invariant lookups bound once (local loads beat global/attribute ones)
+    affine_expression = pl.LpAffineExpression
+    add_constraint = solver.add_constraint
+    resource_constraints = {}
+    for r, (resource_name, total_available) in enumerate(
+        zip(resource_names, totals.tolist())
+    ):
+        start, end = indptr[r], indptr[r + 1]
 
         # Sum of resource usage across selected items <= available
-        resource_expr = pl.lpSum([
-            item.get(resource_name, 0) * variables[item["name"]]
-            for item in item_requirements
-        ])
+        resource_expr = affine_expression(
+            [(vars_in_order[j], c) for j, c in zip(indices[start:end], data[start:end])]
+        )
 
-        solver.add_constraint(
-            resource_expr <= total_available,
+        constraint = resource_expr <= total_available
+        add_constraint(
+            constraint,
             name=f"resource_{resource_name}"
         )
+        # Keyed by the name PuLP stored (it sanitizes characters like spaces)
+        resource_constraints[constraint.name] = resource_name
 
     # Add custom constraints if provided
     if constraints:
         _add_custom_constraints(solver, variables, constraints)
 
-    # Solve
-    try:
-        status = solver.solve(time_limit=time_limit, verbose=verbose)
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e),
-            "message": "Solver encountered an error during optimization"
-        }
-
-    # Build result
-    result = _build_allocation_result(
-        solver,
-        item_names,
-        resources,
-        item_requirements,
-        item_values,
-        objective["sense"],
-        objective_breakdown
-    )
-
-    # Add Monte Carlo compatible output for validation
-    if solver.is_feasible():
-        mc_output = _create_mc_compatible_output(
-            result["allocation"],
-            item_values,
-            result["objective_value"],
-            objective["sense"]
+    # Structural infeasibility check: an item forced into every solution that
+    # on its own needs more of some resource than is available
+    entries = requirements.tocoo()
+    over_capacity = {
+        item_names[j]
+        for j in entries.col[entries.data > totals[entries.row]].tolist()
+    }
+    forced_over_capacity = bool(
+        over_capacity and not over_capacity.isdisjoint(
+            _forced_items(variables, constraints or [])
         )
-        result["monte_carlo_compatible"] = mc_output
+    )
 
-    return result
+    return {
+        "solver": solver,
+        "variables": variables,
+        "item_names": item_names,
+        "totals": totals,
+        "integral_usage": integral_usage,
+        "resource_constraints": resource_constraints,
+        "forced_over_capacity": forced_over_capacity,
+        "lock": threading.Lock()
+    }
 
 
 def _process_objective_values(
@@ -196,40 +357,74 @@ def _process_objective_values(
 
     # Override with MC values if integration is specified
     if mc_integration:
-        mode = mc_integration.get("mode", "percentile")
-        mc_output = mc_integration.get("mc_output")
+        mc_values = _resolve_mc_values(mc_integration)
+        if mc_values is not None:
+            _merge_mc_values(item_values, mc_values)
 
-        if mc_output is None:
-            raise ValueError(
-                "monte_carlo_integration requires 'mc_output' field"
-            )
+    return item_values
 
-        if mode == "percentile":
-            percentile = mc_integration.get("percentile", "p50")
-            mc_values = MonteCarloIntegration.extract_percentile_values(
-                mc_output,
-                percentile
-            )
-            # Update item values with MC percentile values
-            for name in item_values.keys():
-                if name in mc_values:
-                    item_values[name] = mc_values[name]
-
-        elif mode == "expected":
-            mc_values = MonteCarloIntegration.extract_expected_values(mc_output)
-            for name in item_values.keys():
-                if name in mc_values:
-                    item_values[name] = mc_values[name]
-
-        elif mode == "scenarios":
-            # For scenario mode, we just use expected values as base
-            # (robust optimization across scenarios is handled by optimize_robust tool)
-            mc_values = MonteCarloIntegration.extract_expected_values(mc_output)
-            for name in item_values.keys():
-                if name in mc_values:
-                    item_values[name] = mc_values[name]
 
-    return item_values
+# MC value extraction per integration mode: (mc_output, mc_integration) -> values.
+# For scenario mode, we just use expected values as base
+# (robust optimization across scenarios is handled by optimize_robust tool)
+_MC_EXTRACTORS = {
+    "percentile": lambda mc_output, mc_integration: (
+        MonteCarloIntegration.extract_percentile_values(
+            mc_output,
+            mc_integration.get("percentile", "p50")
+        )
+    ),
+    "expected": lambda mc_output, _: MonteCarloIntegration.extract_expected_values(mc_output),
+    "scenarios": lambda mc_output, _: MonteCarloIntegration.extract_expected_values(mc_output),
+}
+
+
+def _resolve_mc_values(
+    mc_integration: Dict[str, Any]
+) -> Optional[Dict[str, float]]:
+    """
+    Extract the per-item values selected by a Monte Carlo integration spec.
+
+    Args:
+        mc_integration: MC integration settings (mode, percentile, mc_output)
+
+    Returns:
+        Dict mapping item names to MC values, or None for an unknown mode
+
+    Raises:
+        ValueError: If mc_output is missing
+    """
+    mode = mc_integration.get("mode", "percentile")
+    mc_output = mc_integration.get("mc_output")
+
+    if mc_output is None:
+        raise ValueError(
+            "monte_carlo_integration requires 'mc_output' field"
+        )
+
+    extract = _MC_EXTRACTORS.get(mode)
+    if extract is None:
+        return None
+
+    return extract(mc_output, mc_integration)
+
+
+def _merge_mc_values(
+    values: Dict[str, float],
+    mc_values: Dict[str, float]
+):
+    """
+    Overwrite values in place with MC values for the items both share.
+
+    Items only present in mc_values are ignored, so the item universe and
+    its order are unchanged.
+
+    Args:
+        values: Item values to update
+        mc_values: MC values by item name
+    """
+    # Key-view intersection runs in C instead of a per-item membership test
+    values.update({name: mc_values[name] for name in values.keys() & mc_values.keys()})
 
 
 def _process_multi_objective(
@@ -250,21 +445,41 @@ def _process_multi_objective(
     Returns:
         Tuple of (objective_expression, objective_breakdown_dict)
         - objective_expression: PuLP linear expression
-        - objective_breakdown_dict: Dict mapping function names to values (multi-obj only)
+        - objective_breakdown_dict: Dict mapping function names to their weight,
+          per-item coefficient row in variable order and whether all its item
+          values are ints (multi-obj only)
     """
     if "functions" not in objective:
-        # Single objective - use existing item_values
-        obj_expr = pl.lpSum([
-            item_values[name] * variables[name]
-            for name in variables.keys()
-        ])
+        # Single objective - coefficient vector aligned with variable order
+        coefficients = np.fromiter(
+            (item_values[name] for name in variables),
+            dtype=float,
+            count=len(variables)
+        )
+        obj_expr = pl.LpAffineExpression(
+            [(var, c) for var, c in zip(variables.values(), coefficients.tolist()) if c != 0]
+        )
         return obj_expr, None
 
-    # Multi-objective: weighted scalarization
-    weighted_expr = 0
+    # Multi-objective: weighted scalarization over a (functions × items)
+    # value matrix, collapsed to one coefficient vector with weights @ values
+    item_index = {name: j for j, name in enumerate(variables)}
+    n_functions = len(objective["functions"])
+    values_matrix = np.zeros((n_functions, len(item_index)), dtype=float)
+    weights = np.empty(n_functions, dtype=float)
     objective_breakdown = {}
 
-    for func in objective["functions"]:
+    # MC values are shared by every function, so extract them once
+    # (scenario mode and a missing mc_output leave the given values as is)
+    mc_values = None
+    if (
+        monte_carlo_integration
+        and monte_carlo_integration.get("mc_output") is not None
+        and monte_carlo_integration.get("mode", "percentile") != "scenarios"
+    ):
+        mc_values = _resolve_mc_values(monte_carlo_integration)
+
+    for k, func in enumerate(objective["functions"]):
         func_name = func["name"]
         weight = func["weight"]
 
@@ -274,43 +489,31 @@ def _process_multi_objective(
             func_item_values[item["name"]] = item["value"]
 
         # Override with MC values if provided
-        if monte_carlo_integration:
-            mode = monte_carlo_integration.get("mode", "percentile")
-            mc_output = monte_carlo_integration.get("mc_output")
-
-            if mc_output is not None:
-                if mode == "percentile":
-                    percentile = monte_carlo_integration.get("percentile", "p50")
-                    mc_values = MonteCarloIntegration.extract_percentile_values(
-                        mc_output,
-                        percentile
-                    )
-                    for name in func_item_values.keys():
-                        if name in mc_values:
-                            func_item_values[name] = mc_values[name]
-
-                elif mode == "expected":
-                    mc_values = MonteCarloIntegration.extract_expected_values(mc_output)
-                    for name in func_item_values.keys():
-                        if name in mc_values:
-                            func_item_values[name] = mc_values[name]
-
-        # Build expression for this function
-        func_expr = pl.lpSum([
-            func_item_values.get(name, 0) * variables[name]
-            for name in variables.keys()
-            if name in func_item_values
-        ])
-
-        # Add to weighted sum
-        weighted_expr += weight * func_expr
-
-        # Store for breakdown (will be calculated after solve)
+        if mc_values is not None:
+            _merge_mc_values(func_item_values, mc_values)
+
+        # Fill this function's row (items it doesn't mention stay 0)
+        integral = True
+        for name, value in func_item_values.items():
+            j = item_index.get(name)
+            if j is not None:
+                values_matrix[k, j] = value
+                integral = integral and isinstance(value, int)
+        weights[k] = weight
+
+        # Store for breakdown (evaluated after solve from the same row
+        # of coefficients the objective is built from)
         objective_breakdown[func_name] = {
             "weight": weight,
-            "item_values": func_item_values
+            "coefficients": values_matrix[k],
+            "integral": integral
         }
 
+    coefficients = weights @ values_matrix
+    weighted_expr = pl.LpAffineExpression(
+        [(var, c) for var, c in zip(variables.values(), coefficients.tolist()) if c != 0]
+    )
+
     return weighted_expr, objective_breakdown
 
 
@@ -337,79 +540,181 @@ def _add_custom_constraints(
         constraint_type = constraint.get("type", "max")
         description = constraint.get("description", f"constraint_{i}")
 
-        if constraint_type == "max" or constraint_type == "min":
-            # Linear constraint: sum(items) <= or >= limit
-            items = constraint.get("items", [])
-            limit = constraint.get("limit", 0)
-
-            expr = pl.lpSum([variables[item] for item in items if item in variables])
-
-            if constraint_type == "max":
-                solver.add_constraint(
-                    expr <= limit,
-                    name=f"custom_{description}_{i}"
-                )
-            else:  # min
-                solver.add_constraint(
-                    expr >= limit,
-                    name=f"custom_{description}_{i}"
-                )
-
-        elif constraint_type == "conditional":
-            # If-then logic: if condition_item selected, then then_item must be selected
-            # Formulation: x_then >= x_condition
-            condition_item = constraint.get("condition_item")
-            then_item = constraint.get("then_item")
-
-            if condition_item not in variables:
-                raise ValueError(
-                    f"Conditional constraint: condition_item '{condition_item}' not in variables"
-                )
-            if then_item not in variables:
-                raise ValueError(
-                    f"Conditional constraint: then_item '{then_item}' not in variables"
-                )
-
-            solver.add_constraint(
-                variables[then_item] >= variables[condition_item],
-                name=f"conditional_{description}_{i}"
+        handler = _CONSTRAINT_HANDLERS.get(constraint_type)
+        if handler is None:
+            raise ValueError(
+                f"Invalid constraint type '{constraint_type}'. "
+                f"Must be one of: 'min', 'max', 'conditional', 'disjunctive', 'mutex'"
             )
 
-        elif constraint_type == "disjunctive":
-            # OR logic: at least min_selected of items must be selected
-            # Formulation: sum(x_i) >= min_selected
-            items = constraint.get("items", [])
-            min_selected = constraint.get("min_selected", 1)
+        handler(solver, variables, constraint, i, description)
 
-            if not items:
-                raise ValueError("Disjunctive constraint requires 'items' list")
 
-            expr = pl.lpSum([variables[item] for item in items if item in variables])
-            solver.add_constraint(
-                expr >= min_selected,
-                name=f"disjunctive_{description}_{i}"
-            )
+def _sum_of_items(variables: Dict[str, Any], items: List[str]) -> Any:
+    """
+    Sum the selection variables of the named items.
+
+    One dict.get per item (instead of a membership test plus an index);
+    items that aren't variables are skipped.
 
-        elif constraint_type == "mutex":
-            # Mutual exclusivity: exactly N items must be selected
-            # Formulation: sum(x_i) = exactly
-            items = constraint.get("items", [])
-            exactly = constraint.get("exactly", 1)
+    Args:
+        variables: Decision variables
+        items: Item names
 
-            if not items:
-                raise ValueError("Mutex constraint requires 'items' list")
+    Returns:
+        PuLP linear expression
+    """
+    return pl.lpSum([var for var in map(variables.get, items) if var is not None])
 
-            expr = pl.lpSum([variables[item] for item in items if item in variables])
-            solver.add_constraint(
-                expr == exactly,
-                name=f"mutex_{description}_{i}"
-            )
 
-        else:
-            raise ValueError(
-                f"Invalid constraint type '{constraint_type}'. "
-                f"Must be one of: 'min', 'max', 'conditional', 'disjunctive', 'mutex'"
-            )
+def _add_max_constraint(
+    solver: PuLPSolver,
+    variables: Dict[str, Any],
+    constraint: Dict[str, Any],
+    i: int,
+    description: str
+):
+    """Linear constraint: sum(items) <= limit"""
+    expr = _sum_of_items(variables, constraint.get("items", []))
+    solver.add_constraint(
+        expr <= constraint.get("limit", 0),
+        name=f"custom_{description}_{i}"
+    )
+
+
+def _add_min_constraint(
+    solver: PuLPSolver,
+    variables: Dict[str, Any],
+    constraint: Dict[str, Any],
+    i: int,
+    description: str
+):
+    """Linear constraint: sum(items) >= limit"""
+    expr = _sum_of_items(variables, constraint.get("items", []))
+    solver.add_constraint(
+        expr >= constraint.get("limit", 0),
+        name=f"custom_{description}_{i}"
+    )
+
+
+def _add_conditional_constraint(
+    solver: PuLPSolver,
+    variables: Dict[str, Any],
+    constraint: Dict[str, Any],
+    i: int,
+    description: str
+):
+    """
+    If-then logic: if condition_item selected, then then_item must be selected.
+
+    Formulation: x_then >= x_condition
+    """
+    condition_item = constraint.get("condition_item")
+    then_item = constraint.get("then_item")
+
+    if condition_item not in variables:
+        raise ValueError(
+            f"Conditional constraint: condition_item '{condition_item}' not in variables"
+        )
+    if then_item not in variables:
+        raise ValueError(
+            f"Conditional constraint: then_item '{then_item}' not in variables"
+        )
+
+    solver.add_constraint(
+        variables[then_item] >= variables[condition_item],
+        name=f"conditional_{description}_{i}"
+    )
+
+
+def _add_disjunctive_constraint(
+    solver: PuLPSolver,
+    variables: Dict[str, Any],
+    constraint: Dict[str, Any],
+    i: int,
+    description: str
+):
+    """
+    OR logic: at least min_selected of items must be selected.
+
+    Formulation: sum(x_i) >= min_selected
+    """
+    items = constraint.get("items", [])
+    if not items:
+        raise ValueError("Disjunctive constraint requires 'items' list")
+
+    solver.add_constraint(
+        _sum_of_items(variables, items) >= constraint.get("min_selected", 1),
+        name=f"disjunctive_{description}_{i}"
+    )
+
+
+def _add_mutex_constraint(
+    solver: PuLPSolver,
+    variables: Dict[str, Any],
+    constraint: Dict[str, Any],
+    i: int,
+    description: str
+):
+    """
+    Mutual exclusivity: exactly N items must be selected.
+
+    Formulation: sum(x_i) = exactly
+    """
+    items = constraint.get("items", [])
+    if not items:
+        raise ValueError("Mutex constraint requires 'items' list")
+
+    solver.add_constraint(
+        _sum_of_items(variables, items) == constraint.get("exactly", 1),
+        name=f"mutex_{description}_{i}"
+    )
+
+
+# Custom constraint builders by type:
+# (solver, variables, constraint, index, description) -> None
+_CONSTRAINT_HANDLERS = {
+    "max": _add_max_constraint,
+    "min": _add_min_constraint,
+    "conditional": _add_conditional_constraint,
+    "disjunctive": _add_disjunctive_constraint,
+    "mutex": _add_mutex_constraint,
+}
+
+
+def _forced_items(
+    variables: Dict[str, Any],
+    constraints: List[Dict[str, Any]]
+) -> set:
+    """
+    Find items every feasible solution must select.
+
+    An item is forced when a min, disjunctive or mutex constraint requires
+    at least as many selections as its list has (known) items.
+
+    Args:
+        variables: Decision variables
+        constraints: Custom constraint specifications
+
+    Returns:
+        Set of forced item names
+    """
+    required_keys = {"min": "limit", "disjunctive": "min_selected", "mutex": "exactly"}
+    required_defaults = {"min": 0, "disjunctive": 1, "mutex": 1}
+
+    forced = set()
+    for constraint in constraints:
+        constraint_type = constraint.get("type", "max")
+        key = required_keys.get(constraint_type)
+        if key is None:
+            continue
+
+        items = {item for item in constraint.get("items", []) if item in variables}
+        required = constraint.get(key, required_defaults[constraint_type])
+        if items and required >= len(items):
+            forced |= items
+
+    return forced
 
 
 def _build_allocation_result(
@@ -417,6 +722,10 @@ def _build_allocation_result(
     item_names: List[str],
     resources: Dict[str, Dict[str, float]],
     item_requirements: List[Dict[str, Any]],
+    requirements: sparse.csr_matrix,
+    totals: np.ndarray,
+    integral_usage: List[bool],
+    resource_constraints: Dict[str, str],
     item_values: Dict[str, float],
     objective_sense: str,
     objective_breakdown: Optional[Dict[str, Dict[str, Any]]] = None
@@ -429,6 +738,10 @@ def _build_allocation_result(
         item_names: List of item names
         resources: Resource specifications
         item_requirements: Item requirements
+        requirements: Sparse resource requirement matrix (resources × items)
+        totals: Available amount per resource (resources order)
+        integral_usage: Per resource, whether all item amounts are ints
+        resource_constraints: Resource constraint names mapped to resource names
         item_values: Item objective values
         objective_sense: "maximize" or "minimize"
         objective_breakdown: Multi-objective breakdown info (if multi-objective)
@@ -448,7 +761,9 @@ def _build_allocation_result(
         result["message"] = _generate_infeasibility_message(
             solver.status.value,
             resources,
-            item_requirements
+            item_requirements,
+            requirements,
+            totals
         )
         return result
 
@@ -456,35 +771,60 @@ def _build_allocation_result(
     solution = solver.get_solution()
     result["objective_value"] = solver.get_objective_value()
 
+    # Selection as an int8 vector in item order; every sum over items below
+    # is a dot product against it. Binary variables: 0 or 1, rounded since
+    # HiGHS reports them within tolerance (0.9999999999999969, -4.9e-14) (an
+    # item with only zero coefficients never enters the model and has no
+    # value; leaving it out is optimal)
+    selected = np.rint(np.fromiter(
+        (solution.get(name, 0) for name in item_names),
+        dtype=np.float64,
+        count=len(item_names)
+    )).astype(np.int8)
+
     # Format allocation (which items were selected)
-    allocation = {
-        name: int(solution[name])  # Binary variables: 0 or 1
-        for name in item_names
-    }
+    allocation = dict(zip(item_names, selected.tolist()))
     result["allocation"] = allocation
 
-    # Calculate resource usage
-    resource_usage = {}
-    for resource_name in resources.keys():
-        used = sum(
-            item.get(resource_name, 0) * allocation[item["name"]]
-            for item in item_requirements
-        )
-        total = resources[resource_name]["total"]
-        resource_usage[resource_name] = {
-            "used": used,
-            "available": total,
-            "remaining": total - used,
-            "utilization_pct": (used / total * 100) if total > 0 else 0
+    # Selected item names, in input order (saves callers filtering allocation)
+    result["selected_items"] = [
+        item_names[j] for j in np.flatnonzero(selected == 1).tolist()
+    ]
+
+    # Calculate resource usage (one matrix-vector product over all resources)
+    used_per_resource = requirements @ selected
+    remaining = totals - used_per_resource
+    # Utilization is 0 for resources with nothing available
+    utilization = np.divide(
+        used_per_resource * 100,
+        totals,
+        out=np.zeros_like(used_per_resource),
+        where=totals > 0
+    )
+    # Int amounts (and int totals, for what remains) give int figures
+    resource_usage = {
+        resource_name: {
+            "used": round(used) if integral else used,
+            "available": spec["total"],
+            "remaining": round(left) if integral and isinstance(spec["total"], int) else left,
+            "utilization_pct": pct
         }
+        for (resource_name, spec), used, left, pct, integral in zip(
+            resources.items(),
+            used_per_resource.tolist(),
+            remaining.tolist(),
+            utilization.tolist(),
+            integral_usage
+        )
+    }
     result["resource_usage"] = resource_usage
 
     # Add shadow prices (marginal value of resources)
     shadow_prices = solver.get_shadow_prices()
     result["shadow_prices"] = {
-        name.replace("resource_", ""): price
+        resource_constraints[name]: price
         for name, price in shadow_prices.items()
-        if name.startswith("resource_")
+        if name in resource_constraints
     }
 
     # Add selected items summary (for single objective)
@@ -502,13 +842,20 @@ def _build_allocation_result(
 
     # Add multi-objective breakdown if applicable
     if objective_breakdown is not None:
+        # (functions × items) coefficients, so every function's value under
+        # the allocation comes out of one matrix-vector product
+        coefficient_matrix = np.vstack(
+            [func_info["coefficients"] for func_info in objective_breakdown.values()]
+        ).reshape(len(objective_breakdown), len(item_names))
+        func_values = (coefficient_matrix @ selected).tolist()
+
         breakdown_values = {}
-        for func_name, func_info in objective_breakdown.items():
-            # Calculate value for this function given the allocation
-            func_value = sum(
-                func_info["item_values"].get(name, 0) * allocation[name]
-                for name in item_names
-            )
+        for (func_name, func_info), func_value in zip(
+            objective_breakdown.items(), func_values
+        ):
+            # Int item values give an int total, as a Python sum would
+            if func_info["integral"]:
+                func_value = round(func_value)
             breakdown_values[func_name] = {
                 "value": func_value,
                 "weight": func_info["weight"],
@@ -522,7 +869,9 @@ def _build_allocation_result(
 def _generate_infeasibility_message(
     status: str,
     resources: Dict[str, Any],
-    item_requirements: List[Dict[str, Any]]
+    item_requirements: List[Dict[str, Any]],
+    requirements: sparse.csr_matrix,
+    totals: np.ndarray
 ) -> str:
     """
     Generate helpful error message for infeasible/unbounded problems.
@@ -531,23 +880,26 @@ def _generate_infeasibility_message(
         status: Solver status
         resources: Resource specifications
         item_requirements: Item requirements
+        requirements: Sparse resource requirement matrix (resources × items)
+        totals: Available amount per resource (resources order)
 
     Returns:
         Helpful error message
     """
     if status == "infeasible":
-        # Check if any single item exceeds resources
+        # Check if any single item exceeds resources (item-major order)
+        resource_names = list(resources.keys())
         infeasible_items = []
-        for item in item_requirements:
-            for resource_name, amount in item.items():
-                if resource_name == "name":
-                    continue
-                if resource_name in resources:
-                    if amount > resources[resource_name]["total"]:
-                        infeasible_items.append(
-                            f"Item '{item['name']}' requires {amount} {resource_name} "
-                            f"but only {resources[resource_name]['total']} available"
-                        )
+        entries = requirements.tocoo()
+        over = entries.data > totals[entries.row]
+        rows, cols = entries.row[over], entries.col[over]
+        for k in np.lexsort((rows, cols)):
+            item = item_requirements[cols[k]]
+            resource_name = resource_names[rows[k]]
+            infeasible_items.append(
+                f"Item '{item['name']}' requires {item[resource_name]} {resource_name} "
+                f"but only {resources[resource_name]['total']} available"
+            )
 
         if infeasible_items:
             return (
@@ -568,6 +920,7 @@ def _generate_infeasibility_message(
 
 def _create_mc_compatible_output(
     allocation: Dict[str, int],
+    selected_items: List[str],
     item_values: Dict[str, float],
     objective_value: float,
     objective_sense: str
@@ -577,6 +930,7 @@ def _create_mc_compatible_output(
 
     Args:
         allocation: Item allocation (0 or 1 for each item)
+        selected_items: Names of selected items
         item_values: Value/return for each item
         objective_value: Optimal objective value
         objective_sense: "maximize" or "minimize"
@@ -584,23 +938,24 @@ def _create_mc_compatible_output(
     Returns:
         MC compatible output dict
     """
-    # Identify selected items
-    selected_items = [name for name, selected in allocation.items() if selected == 1]
-
-    # Create assumptions (treat item values as uncertain)
-    assumptions = []
-    for name, value in item_values.items():
-        assumptions.append({
+    # Create assumptions (treat item values as uncertain); the standard
+    # deviations are computed for all items in one vectorized step
+    values = list(item_values.values())
+    stds = (np.asarray(values, dtype=np.float64) * 0.15).tolist()  # Assume 15% standard deviation
+    assumptions = [
+        {
             "name": f"{name}_value",
             "value": value,
             "distribution": {
                 "type": "normal",
                 "params": {
                     "mean": value,
-                    "std": value * 0.15  # Assume 15% standard deviation
+                    "std": std
                 }
             }
-        })
+        }
+        for name, value, std in zip(item_values.keys(), values, stds)
+    ]
 
     # Create outcome function description
     outcome_function = (
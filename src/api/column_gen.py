@@ -10,11 +10,61 @@ Use cases:
 - Vehicle routing with large route sets
 """
 
+import heapq
+import operator
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from typing import Dict, List, Any, Optional, Callable
+import numpy as np
 import pulp as pl
+from scipy import sparse
+
+try:
+    import highspy
+    HIGHSPY_AVAILABLE = True
+except ImportError:
+    HIGHSPY_AVAILABLE = False
 
 from ..solvers.pulp_solver import PuLPSolver
-from ..solvers.base_solver import ObjectiveSense
+from ..solvers.base_solver import ObjectiveSense, OptimizationStatus
+
+
+# Last knapsack pricing optimum per subproblem (capacity, item names/sizes):
+# (best reduced cost, item values). Used to prove, without running the DP,
+# that no improving pattern exists under new duals. Shared by pricing
+# threads and concurrent requests, so accessed under _pricing_bounds_lock
+_pricing_bounds: Dict[tuple, tuple] = {}
+_pricing_bounds_lock = threading.Lock()
+_PRICING_BOUNDS_MAXSIZE = 128
+
+# Master constraint type -> comparison building the PuLP row (expr op rhs);
+# any other type is an equality
+_CONSTRAINT_OPS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+}
+
+
+@dataclass(slots=True)
+class _ColumnRecord:
+    """Master problem column (id None: reported by its position)."""
+    id: Optional[str]
+    cost: float
+    coefficients: Dict[str, float]
+    reduced_cost: float = 0.0
+
+
+def _column_record(column: Dict[str, Any]) -> _ColumnRecord:
+    """Convert a column dict (accepting "coefficients" or "coverage") to a record."""
+    return _ColumnRecord(
+        id=column.get("id"),
+        cost=column.get("cost", 0),
+        # Support both "coefficients" and "coverage" keys
+        coefficients=column.get("coefficients") or column.get("coverage", {})
+    )
 
 
 def optimize_column_gen(
@@ -38,6 +88,13 @@ def optimize_column_gen(
         pricing_problem: Pricing subproblem specification:
                         - "type": "knapsack" | "shortest_path" | "custom"
                         - "parameters": {...} (problem-specific)
+                        - "columns": [...] (custom: candidate pool, same
+                          format as initial_columns)
+                        - "subproblems": [{...}, ...] (independent pricing
+                          problems, each in the format above, solved in parallel)
+                        - "parallel_threads": int (default 0 = all cores)
+                        - "max_columns_per_iter": int (default 10; most
+                          negative reduced costs kept)
         initial_columns: Starting feasible columns:
                         - [{"id": str, "cost": float, "coefficients": {...}}, ...]
         max_iterations: Maximum column generation iterations
@@ -80,15 +137,42 @@ def optimize_column_gen(
     verbose = solver_opts.get("verbose", False)
 
     # Initialize columns
-    columns = initial_columns if initial_columns else _generate_trivial_initial_columns(master_problem)
+    initial = (
+        [_column_record(column) for column in initial_columns] if initial_columns
+        else _generate_trivial_initial_columns(master_problem)
+    )
 
-    if len(columns) == 0:
+    if len(initial) == 0:
         raise ValueError("No initial columns provided and could not generate trivial columns")
 
     # Track initial column count before generation loop
-    initial_column_count = len(columns)
+    initial_column_count = len(initial)
+
+    # Master constraints are fixed across iterations; the column store is
+    # only extended as columns are generated
+    constraints = _master_constraints(master_problem)
+    constraint_index = {
+        constr.get("name", "constraint"): r for r, constr in enumerate(constraints)
+    }
+    columns = ColumnStore(constraint_index, len(constraints))
+    columns.append(initial)
 
-    convergence_history = []
+    # Candidate pool for custom pricing, as one sparse matrix priced per
+    # iteration with a single mat-vec product
+    candidate_pool = _build_candidate_pool(
+        pricing_problem, constraints, constraint_index, master_problem.get("objective") != "minimize"
+    )
+
+    # With highspy, one HiGHS LP persists across iterations: new columns are
+    # appended and simplex restarts from the previous optimal basis (still
+    # primal feasible, since new columns enter at 0) instead of rebuilding
+    highs = _create_highs_rmp(master_problem, constraints, verbose) if HIGHSPY_AVAILABLE else None
+
+    # Bound progression in preallocated typed buffers (one slot per possible
+    # iteration); converted to the reported list of dicts once at the end
+    lb_history = np.empty(max_iterations, dtype=np.float64)
+    nc_history = np.empty(max_iterations, dtype=np.int64)
+    iter_count = 0
 
     # Column generation main loop
     for iteration in range(max_iterations):
@@ -96,12 +180,16 @@ def optimize_column_gen(
             print(f"\nIteration {iteration + 1}: {len(columns)} columns")
 
         # Solve Restricted Master Problem (RMP)
-        rmp_result = _solve_rmp(
-            master_problem,
-            columns,
-            time_limit,
-            verbose
-        )
+        if highs is not None:
+            rmp_result = _solve_highs_rmp(highs, columns, time_limit)
+        else:
+            rmp_result = _solve_rmp(
+                master_problem,
+                constraints,
+                columns,
+                time_limit,
+                verbose
+            )
 
         if rmp_result["status"] != "optimal":
             return {
@@ -112,21 +200,21 @@ def optimize_column_gen(
             }
 
         # Record bounds
-        convergence_history.append({
-            "iteration": iteration,
-            "lower_bound": rmp_result["objective_value"],
-            "num_columns": len(columns)
-        })
+        lb_history[iter_count] = rmp_result["objective_value"]
+        nc_history[iter_count] = len(columns)
+        iter_count += 1
 
-        # Extract dual values
-        duals = rmp_result.get("duals", {})
+        # Extract dual values (aligned with constraint rows)
+        duals = rmp_result["duals"]
 
         # Solve pricing problem
         new_columns = _solve_pricing(
             pricing_problem,
             duals,
+            constraint_index,
             optimality_gap,
-            verbose
+            verbose,
+            candidate_pool
         )
 
         # Check convergence
@@ -136,14 +224,14 @@ def optimize_column_gen(
             break
 
         # Check if best column has negative reduced cost
-        best_reduced_cost = min(col.get("reduced_cost", 0) for col in new_columns)
+        best_reduced_cost = min(col.reduced_cost for col in new_columns)
         if best_reduced_cost >= -optimality_gap:
             if verbose:
                 print(f"  Converged! Best reduced cost: {best_reduced_cost:.6f}")
             break
 
         # Add new columns
-        columns.extend(new_columns)
+        columns.append(new_columns)
 
         if verbose:
             print(f"  Added {len(new_columns)} new columns (reduced cost: {best_reduced_cost:.6f})")
@@ -156,26 +244,28 @@ def optimize_column_gen(
         "objective_value": obj_value,
         "column_count": len(columns),
         "iterations": iteration + 1,
-        "convergence_history": convergence_history,
+        "convergence_history": [
+            {"iteration": i, "lower_bound": lower_bound, "num_columns": num_columns}
+            for i, (lower_bound, num_columns) in enumerate(
+                zip(lb_history[:iter_count].tolist(), nc_history[:iter_count].tolist())
+            )
+        ],
         "num_initial_columns": initial_column_count,
         "num_generated_columns": len(columns) - initial_column_count
     }
 
-    # Extract solution (selected columns)
+    # Extract solution (selected columns): only the active weights are visited
     selected_columns = []
-    column_solution = rmp_result.get("solution", {})
-
-    for col_idx, column in enumerate(columns):
-        col_var_name = f"lambda_{col_idx}"
-        if col_var_name in column_solution:
-            weight = column_solution[col_var_name]
-            if weight > 1e-6:
-                selected_columns.append({
-                    "column_id": column.get("id", f"col_{col_idx}"),
-                    "weight": weight,
-                    "cost": column.get("cost", 0),
-                    "coefficients": column.get("coefficients", {})
-                })
+    weights = rmp_result["weights"]
+
+    for col_idx in np.flatnonzero(weights > 1e-6).tolist():
+        column = columns.columns[col_idx]
+        selected_columns.append({
+            "column_id": column.id if column.id is not None else f"col_{col_idx}",
+            "weight": float(weights[col_idx]),
+            "cost": column.cost,
+            "coefficients": column.coefficients
+        })
 
     result["optimal_solution"] = selected_columns
 
@@ -196,9 +286,150 @@ def optimize_column_gen(
     return result
 
 
+def _master_constraints(master_problem: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Master problem constraints, accepting both "constraints" and "demands".
+
+    Args:
+        master_problem: Master problem specification
+
+    Returns:
+        List of {"name", "type", "rhs"} constraint dicts
+    """
+    # Handle both "constraints" list and "demands" dict formats
+    constraints = master_problem.get("constraints", [])
+    demands = master_problem.get("demands", {})
+
+    # Convert demands dict to constraints list if needed
+    if demands and not constraints:
+        constraints = [
+            {
+                "name": name,
+                "rhs": rhs,
+                "type": ">="  # Set covering default
+            }
+            for name, rhs in demands.items()
+        ]
+
+    return constraints
+
+
+class ColumnStore:
+    """
+    Struct-of-arrays store of master problem columns.
+
+    Costs and nonzero coefficients are kept column-wise (CSC) in flat arrays
+    indexed by constraint row, so the RMP and pricing read them as NumPy /
+    SciPy arrays instead of walking per-column coefficient dicts. The
+    column records are kept for reporting.
+    """
+
+    def __init__(self, constraint_index: Dict[str, int], num_rows: int):
+        """
+        Initialize an empty store.
+
+        Args:
+            constraint_index: Constraint name -> row index
+            num_rows: Number of master constraints
+        """
+        self.constraint_index = constraint_index
+        self.num_rows = num_rows
+        self.columns: List[_ColumnRecord] = []
+        self._costs: List[float] = []
+        self._indptr: List[int] = [0]
+        self._indices: List[int] = []
+        self._data: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def append(self, columns: List[_ColumnRecord]):
+        """
+        Append columns; only coefficients of known master constraints are stored.
+
+        Args:
+            columns: Column records
+        """
+        constraint_index = self.constraint_index
+        indices = self._indices
+        data = self._data
+
+        for column in columns:
+            self.columns.append(column)
+            self._costs.append(column.cost)
+
+            for name, value in column.coefficients.items():
+                r = constraint_index.get(name)
+                if r is not None and value != 0:
+                    indices.append(r)
+                    data.append(value)
+            self._indptr.append(len(indices))
+
+    def costs(self, start: int = 0) -> np.ndarray:
+        """Costs of columns start.. as a float64 array."""
+        return np.asarray(self._costs[start:], dtype=np.float64)
+
+    def csc_block(self, start: int = 0) -> tuple:
+        """
+        CSC arrays of columns start.., with indptr rebased to 0.
+
+        Returns:
+            Tuple of (indptr int32, indices int32, data float64)
+        """
+        offset = self._indptr[start]
+        return (
+            np.asarray(self._indptr[start:], dtype=np.int32) - offset,
+            np.asarray(self._indices[offset:], dtype=np.int32),
+            np.asarray(self._data[offset:], dtype=np.float64)
+        )
+
+    def matrix(self) -> sparse.csc_matrix:
+        """Coefficient matrix A (constraints x columns)."""
+        indptr, indices, data = self.csc_block()
+        return sparse.csc_matrix((data, indices, indptr), shape=(self.num_rows, len(self)))
+
+
+def _build_candidate_pool(
+    pricing_problem: Dict[str, Any],
+    constraints: List[Dict[str, Any]],
+    constraint_index: Dict[str, int],
+    maximize: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Materialize the custom pricing candidate pool as a sparse matrix.
+
+    Args:
+        pricing_problem: Pricing problem specification
+        constraints: Master constraints
+        constraint_index: Constraint name -> row index
+        maximize: Whether the master problem maximizes
+
+    Returns:
+        Dict with "columns" (records), "costs", "matrix" (constraints x candidates CSC),
+        "in_rmp" mask, "max_columns" per iteration and reduced cost "sign"
+        (-1 for a maximize master), or None if no pool is given
+    """
+    candidates = pricing_problem.get("columns")
+    if pricing_problem.get("type", "custom") != "custom" or not candidates:
+        return None
+
+    pool = ColumnStore(constraint_index, len(constraints))
+    pool.append([_column_record(column) for column in candidates])
+
+    return {
+        "columns": pool.columns,
+        "costs": pool.costs(),
+        "matrix": pool.matrix(),
+        "in_rmp": np.zeros(len(candidates), dtype=bool),
+        "max_columns": pricing_problem.get("max_columns_per_iter", 10),
+        "sign": -1.0 if maximize else 1.0
+    }
+
+
 def _solve_rmp(
     master_problem: Dict[str, Any],
-    columns: List[Dict[str, Any]],
+    constraints: List[Dict[str, Any]],
+    columns: ColumnStore,
     time_limit: Optional[float],
     verbose: bool
 ) -> Dict[str, Any]:
@@ -206,18 +437,17 @@ def _solve_rmp(
     solver = PuLPSolver(problem_name="rmp")
 
     # Create variables (one per column)
-    col_names = [f"lambda_{i}" for i in range(len(columns))]
+    n_columns = len(columns)
+    col_names = [f"lambda_{i}" for i in range(n_columns)]
     variables = solver.create_variables(
         names=col_names,
         var_type="continuous",
         bounds={name: (0, None) for name in col_names}  # Non-negative
     )
+    col_vars = [variables[name] for name in col_names]
 
     # Objective: minimize sum of column costs
-    obj_expr = pl.lpSum([
-        columns[i].get("cost", 0.0) * variables[col_names[i]]
-        for i in range(len(columns))
-    ])
+    obj_expr = pl.LpAffineExpression(zip(col_vars, columns.costs().tolist()))
 
     sense = (
         ObjectiveSense.MINIMIZE if master_problem.get("objective") == "minimize"
@@ -225,37 +455,24 @@ def _solve_rmp(
     )
     solver.set_objective(obj_expr, sense)
 
-    # Add covering constraints
-    # Handle both "constraints" list and "demands" dict formats
-    constraints = master_problem.get("constraints", [])
-    demands = master_problem.get("demands", {})
-
-    # Convert demands dict to constraints list if needed
-    if demands and not constraints:
-        for name, rhs in demands.items():
-            constraints.append({
-                "name": name,
-                "rhs": rhs,
-                "type": ">="  # Set covering default
-            })
+    # Covering constraints: one CSC -> CSR conversion yields every row's
+    # nonzero terms, instead of probing every column for every constraint
+    rows = columns.matrix().tocsr()
+    indptr = rows.indptr.tolist()
+    indices = rows.indices.tolist()
+    data = rows.data.tolist()
 
-    for constr in constraints:
+    for r, constr in enumerate(constraints):
         constr_name = constr.get("name", "constraint")
-        constr_type = constr.get("type", ">=")
+        op = _CONSTRAINT_OPS.get(constr.get("type", ">="), operator.eq)
         rhs = constr.get("rhs", 0)
 
-        # Sum of column coefficients (support both "coefficients" and "coverage" keys)
-        expr = pl.lpSum([
-            (columns[i].get("coefficients") or columns[i].get("coverage", {})).get(constr_name, 0.0) * variables[col_names[i]]
-            for i in range(len(columns))
-        ])
+        start, end = indptr[r], indptr[r + 1]
+        expr = pl.LpAffineExpression(
+            [(col_vars[j], value) for j, value in zip(indices[start:end], data[start:end])]
+        )
 
-        if constr_type == ">=":
-            solver.add_constraint(expr >= rhs, name=constr_name)
-        elif constr_type == "<=":
-            solver.add_constraint(expr <= rhs, name=constr_name)
-        else:
-            solver.add_constraint(expr == rhs, name=constr_name)
+        solver.add_constraint(op(expr, rhs), name=constr_name)
 
     # Solve
     status = solver.solve(time_limit=time_limit, verbose=verbose)
@@ -263,41 +480,160 @@ def _solve_rmp(
     if not solver.is_feasible():
         return {"status": status.value}
 
-    # Extract duals (shadow prices)
-    duals = solver.get_shadow_prices()
+    # Extract duals (shadow prices), in constraint row order
+    duals = np.zeros(len(constraints), dtype=np.float64)
+    if solver.is_optimal():
+        for r, row in enumerate(solver.problem.constraints.values()):
+            duals[r] = row.pi or 0.0
 
     return {
         "status": "optimal",
         "objective_value": solver.get_objective_value(),
-        "solution": solver.get_solution(),
+        "weights": np.fromiter(
+            (var.varValue or 0.0 for var in col_vars), dtype=np.float64, count=n_columns
+        ),
         "duals": duals
     }
 
 
+def _create_highs_rmp(
+    master_problem: Dict[str, Any],
+    constraints: List[Dict[str, Any]],
+    verbose: bool
+) -> Any:
+    """
+    Create a persistent HiGHS LP holding the master constraints (no columns yet).
+
+    Args:
+        master_problem: Master problem specification
+        constraints: Normalized master constraints
+        verbose: Print solver output
+
+    Returns:
+        highspy.Highs instance
+    """
+    highs = highspy.Highs()
+    highs.setOptionValue("output_flag", bool(verbose))
+    # Keep the simplex basis between solves (presolve would discard it)
+    highs.setOptionValue("solver", "simplex")
+    highs.setOptionValue("presolve", "off")
+
+    if master_problem.get("objective") != "minimize":
+        highs.changeObjectiveSense(highspy.ObjSense.kMaximize)
+
+    inf = highspy.kHighsInf
+    lower = np.empty(len(constraints), dtype=np.float64)
+    upper = np.empty(len(constraints), dtype=np.float64)
+    for r, constr in enumerate(constraints):
+        constr_type = constr.get("type", ">=")
+        rhs = constr.get("rhs", 0)
+        lower[r] = rhs if constr_type != "<=" else -inf
+        upper[r] = rhs if constr_type != ">=" else inf
+
+    highs.addRows(
+        len(constraints),
+        lower,
+        upper,
+        0,
+        np.zeros(len(constraints), dtype=np.int32),
+        np.empty(0, dtype=np.int32),
+        np.empty(0, dtype=np.float64)
+    )
+
+    return highs
+
+
+def _solve_highs_rmp(
+    highs: Any,
+    columns: ColumnStore,
+    time_limit: Optional[float]
+) -> Dict[str, Any]:
+    """
+    Append columns not yet in the HiGHS RMP, then re-solve it warm.
+
+    Args:
+        highs: Persistent highspy.Highs RMP
+        columns: RMP column store
+        time_limit: Maximum solving time in seconds
+
+    Returns:
+        Dict with "status" and, when optimal, "objective_value", "weights"
+        (value per column) and "duals" (dual value per constraint row)
+    """
+    first = highs.getNumCol()
+    n_columns = len(columns)
+    if n_columns > first:
+        indptr, indices, data = columns.csc_block(first)
+        highs.addCols(
+            n_columns - first,
+            columns.costs(first),
+            np.zeros(n_columns - first, dtype=np.float64),
+            np.full(n_columns - first, highspy.kHighsInf),
+            len(indices),
+            indptr[:-1],
+            indices,
+            data
+        )
+
+    if time_limit is not None:
+        highs.setOptionValue("time_limit", float(time_limit))
+
+    highs.run()
+
+    model_status = highs.getModelStatus()
+    if model_status != highspy.HighsModelStatus.kOptimal:
+        status_map = {
+            highspy.HighsModelStatus.kInfeasible: OptimizationStatus.INFEASIBLE,
+            highspy.HighsModelStatus.kUnbounded: OptimizationStatus.UNBOUNDED,
+            highspy.HighsModelStatus.kTimeLimit: OptimizationStatus.TIMEOUT,
+        }
+        return {"status": status_map.get(model_status, OptimizationStatus.UNKNOWN).value}
+
+    solution = highs.getSolution()
+    return {
+        "status": "optimal",
+        "objective_value": highs.getInfo().objective_function_value,
+        "weights": np.asarray(solution.col_value, dtype=np.float64),
+        "duals": np.asarray(solution.row_dual, dtype=np.float64)
+    }
+
+
 def _solve_pricing(
     pricing_problem: Dict[str, Any],
-    duals: Dict[str, float],
+    duals: np.ndarray,
+    constraint_index: Dict[str, int],
     optimality_gap: float,
-    verbose: bool
-) -> List[Dict[str, Any]]:
+    verbose: bool,
+    candidate_pool: Optional[Dict[str, Any]] = None
+) -> List[_ColumnRecord]:
     """
     Solve pricing problem to find columns with negative reduced cost.
 
     Args:
         pricing_problem: Pricing problem specification
-        duals: Dual values from RMP
+        duals: Dual values from RMP, by constraint row
+        constraint_index: Constraint name -> row index
         optimality_gap: Threshold for improvement
         verbose: Print output
+        candidate_pool: Custom candidate pool from _build_candidate_pool
 
     Returns:
         List of new columns with negative reduced cost
     """
+    subproblems = pricing_problem.get("subproblems")
+    if subproblems:
+        return _solve_subproblem_pricing(
+            pricing_problem, subproblems, duals, constraint_index, optimality_gap, verbose
+        )
+
     problem_type = pricing_problem.get("type", "custom")
 
     if problem_type == "knapsack":
-        return _solve_knapsack_pricing(pricing_problem, duals, optimality_gap)
+        return _solve_knapsack_pricing(pricing_problem, duals, constraint_index, optimality_gap)
     elif problem_type == "shortest_path":
-        return _solve_shortest_path_pricing(pricing_problem, duals, optimality_gap)
+        return _solve_shortest_path_pricing(pricing_problem, duals, constraint_index, optimality_gap)
+    elif candidate_pool is not None:
+        return _solve_pool_pricing(candidate_pool, duals, optimality_gap)
     else:
         # No new columns (pricing not implemented)
         if verbose:
@@ -305,11 +641,105 @@ def _solve_pricing(
         return []
 
 
+def _solve_subproblem_pricing(
+    pricing_problem: Dict[str, Any],
+    subproblems: List[Dict[str, Any]],
+    duals: np.ndarray,
+    constraint_index: Dict[str, int],
+    optimality_gap: float,
+    verbose: bool
+) -> List[_ColumnRecord]:
+    """
+    Solve independent pricing subproblems on a thread pool.
+
+    The knapsack DP spends its time in NumPy kernels, which release the GIL,
+    so subproblems priced on separate threads overlap.
+
+    Args:
+        pricing_problem: Pricing problem specification ("parallel_threads":
+                        worker count, 0 = all cores)
+        subproblems: Pricing subproblem specifications
+        duals: Dual values from RMP, by constraint row
+        constraint_index: Constraint name -> row index
+        optimality_gap: Threshold for improvement
+        verbose: Print output
+
+    Returns:
+        New columns of all subproblems, in subproblem order, capped at
+        "max_columns_per_iter" (most negative reduced costs kept)
+    """
+    def price(subproblem: Dict[str, Any]) -> List[_ColumnRecord]:
+        return _solve_pricing(subproblem, duals, constraint_index, optimality_gap, verbose)
+
+    threads = pricing_problem.get("parallel_threads", 0) or os.cpu_count() or 1
+    threads = min(threads, len(subproblems))
+
+    if threads <= 1:
+        new_columns = [column for columns in map(price, subproblems) for column in columns]
+    else:
+        # map() yields in submission order, so output is deterministic
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            new_columns = [
+                column for columns in executor.map(price, subproblems) for column in columns
+            ]
+
+    max_columns = pricing_problem.get("max_columns_per_iter", 10)
+    if len(new_columns) > max_columns:
+        keep = heapq.nsmallest(
+            max_columns,
+            range(len(new_columns)),
+            key=lambda k: new_columns[k].reduced_cost
+        )
+        new_columns = [new_columns[k] for k in sorted(keep)]
+
+    return new_columns
+
+
+def _solve_pool_pricing(
+    candidate_pool: Dict[str, Any],
+    duals: np.ndarray,
+    optimality_gap: float
+) -> List[_ColumnRecord]:
+    """
+    Price every pool candidate at once: rc = costs - A.T @ duals.
+
+    Args:
+        candidate_pool: Pool from _build_candidate_pool
+        duals: Dual values from RMP, by constraint row
+        optimality_gap: Threshold for improvement
+
+    Returns:
+        Up to "max_columns" candidates not yet in the RMP with the most
+        negative reduced costs below -optimality_gap (in pool order).
+        For a maximize master reduced costs are negated, so improving
+        columns are negative in either sense.
+    """
+    reduced_costs = candidate_pool["sign"] * (
+        candidate_pool["costs"] - candidate_pool["matrix"].T @ duals
+    )
+
+    improving = np.flatnonzero((reduced_costs < -optimality_gap) & ~candidate_pool["in_rmp"])
+
+    # Only the K most negative enter the RMP; the rest stay in the pool
+    max_columns = candidate_pool["max_columns"]
+    if len(improving) > max_columns:
+        keep = np.argpartition(reduced_costs[improving], max_columns - 1)[:max_columns]
+        improving = np.sort(improving[keep])
+    candidate_pool["in_rmp"][improving] = True
+
+    columns = candidate_pool["columns"]
+    return [
+        replace(columns[j], reduced_cost=float(reduced_costs[j]))
+        for j in improving
+    ]
+
+
 def _solve_knapsack_pricing(
     pricing_problem: Dict[str, Any],
-    duals: Dict[str, float],
+    duals: np.ndarray,
+    constraint_index: Dict[str, int],
     optimality_gap: float
-) -> List[Dict[str, Any]]:
+) -> List[_ColumnRecord]:
     """
     Solve knapsack pricing subproblem for cutting stock.
 
@@ -332,12 +762,13 @@ def _solve_knapsack_pricing(
         else:
             size = int(size_info)
 
-        # Find dual value (try multiple key formats)
-        dual_value = duals.get(name, 0)
-        if dual_value == 0:
-            dual_value = duals.get(f"demand_{name}", 0)
-        if dual_value == 0:
-            dual_value = duals.get(f"item_{name}", 0)
+        # Find dual value (try multiple constraint name formats)
+        dual_value = 0
+        for key in (name, f"demand_{name}", f"item_{name}"):
+            r = constraint_index.get(key)
+            if r is not None and duals[r] != 0:
+                dual_value = float(duals[r])
+                break
 
         if size > 0:
             item_list.append({
@@ -353,54 +784,104 @@ def _solve_knapsack_pricing(
     capacity = int(capacity)
 
     # DP for unbounded knapsack: maximize sum(dual_i * count_i)
-    dp = [0.0] * (capacity + 1)
-    choice = [None] * (capacity + 1)
-
-    for c in range(1, capacity + 1):
-        for item in item_list:
-            size = item["size"]
-            value = item["value"]
-            if size <= c and dp[c - size] + value > dp[c]:
-                dp[c] = dp[c - size] + value
-                choice[c] = item["name"]
+    sizes = np.fromiter((item["size"] for item in item_list), dtype=np.int64, count=len(item_list))
+    values = np.fromiter((item["value"] for item in item_list), dtype=np.float64, count=len(item_list))
+
+    # Skip the DP when the cached optimum proves no pattern can improve:
+    # max_x v.x <= max_x v_prev.x + max_x (v - v_prev).x, and over the box
+    # 0 <= x_i <= capacity // size_i the last term is sum of positive parts
+    bound_key = (capacity, tuple((item["name"], int(item["size"])) for item in item_list))
+    with _pricing_bounds_lock:
+        cached = _pricing_bounds.get(bound_key)
+    if cached is not None:
+        prev_reduced_cost, prev_values = cached
+        increase = np.maximum(values - prev_values, 0.0) @ (capacity // sizes)
+        if prev_reduced_cost - increase >= -optimality_gap:
+            return []
+
+    dp, choice = _unbounded_knapsack_dp(sizes, values, capacity)
 
     # Reconstruct solution pattern
     pattern = {}
     remaining = capacity
-    while remaining > 0 and choice[remaining] is not None:
-        item_name = choice[remaining]
+    while remaining > 0 and choice[remaining] >= 0:
+        j = choice[remaining]
+        item_name = item_list[j]["name"]
         pattern[item_name] = pattern.get(item_name, 0) + 1
-        # Find item size
-        item_size = next(i["size"] for i in item_list if i["name"] == item_name)
-        remaining -= item_size
+        remaining -= sizes[j]
 
     if not pattern:
         return []
 
     # Calculate reduced cost: pattern_cost - sum(dual * coverage)
     pattern_cost = 1.0  # Standard cutting stock: 1 stock used per pattern
-    total_dual_value = dp[capacity]
+    total_dual_value = float(dp[capacity])
     reduced_cost = pattern_cost - total_dual_value
 
+    with _pricing_bounds_lock:
+        if bound_key not in _pricing_bounds and len(_pricing_bounds) >= _PRICING_BOUNDS_MAXSIZE:
+            del _pricing_bounds[next(iter(_pricing_bounds))]
+        _pricing_bounds[bound_key] = (reduced_cost, values)
+
     # Only return if improving (negative reduced cost)
     if reduced_cost >= -optimality_gap:
         return []
 
     # Return new column
-    return [{
-        "id": f"gen_{abs(hash(str(pattern))) % 100000}",
-        "cost": pattern_cost,
-        "coefficients": pattern,
-        "coverage": pattern,  # Alias for compatibility
-        "reduced_cost": reduced_cost
-    }]
+    return [_ColumnRecord(
+        id=f"gen_{abs(hash(str(pattern))) % 100000}",
+        cost=pattern_cost,
+        coefficients=pattern,
+        reduced_cost=reduced_cost
+    )]
+
+
+def _unbounded_knapsack_dp(
+    sizes: np.ndarray,
+    values: np.ndarray,
+    capacity: int
+) -> tuple:
+    """
+    Unbounded knapsack DP over capacities 0..capacity, vectorized in blocks.
+
+    dp[c] only depends on dp[c - size] with size >= the smallest item, so a
+    whole block of that many capacities is filled at once from earlier
+    entries. For each capacity the first item (in input order) achieving
+    the best value is chosen.
+
+    Args:
+        sizes: Positive integer item sizes
+        values: Item values
+        capacity: Knapsack capacity
+
+    Returns:
+        Tuple of (dp, choice): best value per capacity, and the index of the
+        item taken last at that capacity (-1 if none fits)
+    """
+    dp = np.zeros(capacity + 1, dtype=np.float64)
+    choice = np.full(capacity + 1, -1, dtype=np.int64)
+    step = int(sizes.min())
+
+    for start in range(step, capacity + 1, step):
+        block = np.arange(start, min(start + step, capacity + 1))
+        prev = block[None, :] - sizes[:, None]
+        fits = prev >= 0
+        candidates = np.where(fits, dp[np.maximum(prev, 0)] + values[:, None], -np.inf)
+        best = candidates.argmax(axis=0)
+        best_value = candidates[best, np.arange(len(block))]
+        improved = best_value > 0
+        dp[block[improved]] = best_value[improved]
+        choice[block[improved]] = best[improved]
+
+    return dp, choice
 
 
 def _solve_shortest_path_pricing(
     pricing_problem: Dict[str, Any],
-    duals: Dict[str, float],
+    duals: np.ndarray,
+    constraint_index: Dict[str, int],
     optimality_gap: float
-) -> List[Dict[str, Any]]:
+) -> List[_ColumnRecord]:
     """Solve shortest path pricing subproblem."""
     # Simplified implementation
     return []
@@ -408,19 +889,9 @@ def _solve_shortest_path_pricing(
 
 def _generate_trivial_initial_columns(
     master_problem: Dict[str, Any]
-) -> List[Dict[str, Any]]:
+) -> List[_ColumnRecord]:
     """Generate trivial initial columns (one per constraint/demand)."""
-    constraints = master_problem.get("constraints", [])
-    demands = master_problem.get("demands", {})
-
-    # Convert demands dict to constraints list if needed
-    if demands and not constraints:
-        for name, rhs in demands.items():
-            constraints.append({
-                "name": name,
-                "rhs": rhs,
-                "type": ">="
-            })
+    constraints = _master_constraints(master_problem)
 
     columns = []
 
@@ -429,11 +900,10 @@ def _generate_trivial_initial_columns(
         rhs = constr.get("rhs", 1)
 
         # Create column that satisfies just this constraint
-        columns.append({
-            "id": f"initial_{constr_name}",
-            "cost": 1000.0,  # High cost (will be replaced by better columns)
-            "coefficients": {constr_name: rhs},
-            "coverage": {constr_name: rhs}  # Alias for compatibility
-        })
+        columns.append(_ColumnRecord(
+            id=f"initial_{constr_name}",
+            cost=1000.0,  # High cost (will be replaced by better columns)
+            coefficients={constr_name: rhs}
+        ))
 
     return columns
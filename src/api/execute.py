@@ -9,6 +9,10 @@ Use cases:
 - When you know the mathematical form but want solver auto-selection
 """
 
+import json
+import operator
+import threading
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 import pulp as pl
 import numpy as np
@@ -27,6 +31,14 @@ from ..integration.monte_carlo import MonteCarloIntegration
 from ..integration.data_converters import DataConverter
 
 
+# Constraint type -> comparison building the PuLP constraint (expr op rhs)
+_CONSTRAINT_OPS = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+}
+
+
 def optimize_execute(
     problem_definition: Dict[str, Any],
     auto_detect: bool = True,
@@ -193,24 +205,35 @@ def _detect_problem_type(problem_def: Dict[str, Any]) -> str:
     Returns:
         Solver name: "pulp", "scipy", or "cvxpy"
     """
-    variables = problem_def["variables"]
-    objective = problem_def["objective"]
+    # The choice depends only on the set of variable types and the objective's
+    # coefficient keys, so repeated calls with the same structure (e.g. Monte
+    # Carlo loops varying coefficient values) reuse the cached answer
+    return _detect_by_shape(
+        frozenset(v["type"] for v in problem_def["variables"]),
+        tuple(problem_def["objective"].get("coefficients", ()))
+    )
 
-    # Check variable types
-    has_binary = any(v["type"] == "binary" for v in variables)
-    has_integer = any(v["type"] == "integer" for v in variables)
 
+@lru_cache(maxsize=128)
+def _detect_by_shape(var_types: frozenset, objective_keys: tuple) -> str:
+    """
+    Select the solver for a problem shape.
+
+    Args:
+        var_types: Set of variable types present
+        objective_keys: Objective coefficient keys
+
+    Returns:
+        Solver name: "pulp" or "cvxpy"
+    """
     # If integer/binary variables → PuLP
-    if has_binary or has_integer:
+    if var_types - {"continuous"}:
         return "pulp"
 
-    # Check for quadratic terms in objective
-    if "coefficients" in objective:
-        # Dict format - check for quadratic keys
-        coeffs = objective["coefficients"]
-        for key in coeffs.keys():
-            if "*" in str(key) or "**2" in str(key):
-                return "cvxpy"  # Quadratic detected
+    # Check for quadratic terms in objective: keys are variable names
+    # (strings); "x*y" and "x**2" both contain "*"
+    if any("*" in key for key in objective_keys):
+        return "cvxpy"  # Quadratic detected
 
     # Check constraints for nonlinearity
     # For now, default to PuLP for linear continuous
@@ -223,16 +246,77 @@ def _solve_with_pulp(
     verbose: bool
 ) -> Dict[str, Any]:
     """Solve problem using PuLP."""
-    solver = PuLPSolver(problem_name="custom_optimization")
+    # Variables and constraints are built once per structure; repeated calls
+    # (e.g. Monte Carlo loops perturbing the objective) only swap the objective
+    model = _get_pulp_model(
+        json.dumps([problem_def["variables"], problem_def.get("constraints", [])])
+    )
+    solver = model["solver"]
+    pulp_vars = model["variables"]
 
-    variables = problem_def["variables"]
     objective = problem_def["objective"]
-    constraints = problem_def.get("constraints", [])
 
-    # Create variables
-    var_names = [v["name"] for v in variables]
-    var_types = {v["name"]: v["type"] for v in variables}
-    bounds = {v["name"]: v.get("bounds") for v in variables if "bounds" in v}
+    # Build objective from its nonzero terms only (unknown names are ignored);
+    # variables no constraint references keep a 0 term so they stay in the model
+    obj_coeffs = objective.get("coefficients", {})
+    obj_terms = dict.fromkeys(model["unreferenced"].values(), 0)
+    obj_terms.update(
+        (pulp_vars[name], value) for name, value in obj_coeffs.items()
+        if value != 0 and name in pulp_vars
+    )
+    obj_expr = pl.LpAffineExpression(list(obj_terms.items()))
+
+    sense = ObjectiveSense.MAXIMIZE if objective["sense"] == "maximize" else ObjectiveSense.MINIMIZE
+
+    # The cached solver is shared: hold its lock from setting the objective
+    # until the result has been read back
+    with model["lock"]:
+        solver.replace_objective(obj_expr, sense)
+
+        # Solve
+        status = solver.solve(time_limit=time_limit, verbose=verbose)
+
+        # Format result
+        result = {
+            "status": solver.status.value,
+            "is_optimal": solver.is_optimal(),
+            "is_feasible": solver.is_feasible(),
+            "solve_time_seconds": solver.solve_time
+        }
+
+        if solver.is_feasible():
+            # Variables this problem never uses (only their 0 term) are not
+            # reported, as if they were absent from the model
+            solution = solver.get_solution()
+            for name in model["unreferenced"]:
+                if not obj_coeffs.get(name):
+                    solution.pop(name, None)
+
+            result["objective_value"] = solver.get_objective_value()
+            result["solution"] = solution
+            result["shadow_prices"] = solver.get_shadow_prices()
+
+        result["problem_info"] = solver.get_problem_info()
+
+    return result
+
+
+@lru_cache(maxsize=8)
+def _get_pulp_model(spec: str) -> Dict[str, Any]:
+    """
+    Build (once per structure) the PuLP model without its objective.
+
+    Args:
+        spec: JSON-encoded [variables, constraints]
+
+    Returns:
+        Dict with the configured "solver", its "variables", the variables no
+        constraint references ("unreferenced", by name) and a "lock" guarding the
+        solver while a call sets its objective and solves
+    """
+    variables, constraints = json.loads(spec)
+
+    solver = PuLPSolver(problem_name="custom_optimization")
 
     # Group variables by type for solver.create_variables()
     continuous_vars = [v for v in variables if v["type"] == "continuous"]
@@ -261,47 +345,35 @@ def _solve_with_pulp(
         int_created = solver.create_variables(int_names, "integer", int_bounds)
         pulp_vars.update(int_created)
 
-    # Build objective
-    obj_coeffs = objective.get("coefficients", {})
-    obj_expr = pl.lpSum([obj_coeffs.get(name, 0) * pulp_vars[name] for name in var_names])
-
-    sense = ObjectiveSense.MAXIMIZE if objective["sense"] == "maximize" else ObjectiveSense.MINIMIZE
-    solver.set_objective(obj_expr, sense)
+    # Placeholder objective creates the problem; each call replaces it
+    solver.set_objective(pl.LpAffineExpression(), ObjectiveSense.MINIMIZE)
 
-    # Add constraints
+    # Add constraints (nonzero terms only: O(nnz) instead of O(rows x vars);
+    # names that are not variables are ignored)
+    referenced = set()
     for i, constraint in enumerate(constraints):
+        # Unknown constraint types are skipped
+        op = _CONSTRAINT_OPS.get(constraint.get("type", "<="))
+        if op is None:
+            continue
+
         coeffs = constraint.get("coefficients", {})
-        con_expr = pl.lpSum([coeffs.get(name, 0) * pulp_vars[name] for name in var_names])
+        names = [name for name, value in coeffs.items() if value != 0 and name in pulp_vars]
+        referenced.update(names)
+        con_expr = pl.LpAffineExpression([(pulp_vars[name], coeffs[name]) for name in names])
         rhs = constraint.get("rhs", 0)
-        con_type = constraint.get("type", "<=")
 
-        if con_type == "<=":
-            solver.add_constraint(con_expr <= rhs, name=f"constraint_{i}")
-        elif con_type == ">=":
-            solver.add_constraint(con_expr >= rhs, name=f"constraint_{i}")
-        elif con_type == "==":
-            solver.add_constraint(con_expr == rhs, name=f"constraint_{i}")
+        solver.add_constraint(op(con_expr, rhs), name=f"constraint_{i}")
 
-    # Solve
-    status = solver.solve(time_limit=time_limit, verbose=verbose)
-
-    # Format result
-    result = {
-        "status": solver.status.value,
-        "is_optimal": solver.is_optimal(),
-        "is_feasible": solver.is_feasible(),
-        "solve_time_seconds": solver.solve_time
+    return {
+        "solver": solver,
+        "variables": pulp_vars,
+        "unreferenced": {
+            name: var for name, var in pulp_vars.items() if name not in referenced
+        },
+        "lock": threading.Lock()
     }
 
-    if solver.is_feasible():
-        result["objective_value"] = solver.get_objective_value()
-        result["solution"] = solver.get_solution()
-        result["shadow_prices"] = solver.get_shadow_prices()
-
-    result["problem_info"] = solver.get_problem_info()
-
-    return result
-
 
 def _solve_with_scipy(
     problem_def: Dict[str, Any],
@@ -330,33 +402,53 @@ def _solve_with_scipy(
 
     solver.create_variables(var_names, var_type="continuous", bounds=bounds)
 
-    # Build objective function
+    # Build objective function (coefficients aligned with var_names once;
+    # names are only needed again to format the solution)
     obj_coeffs = objective.get("coefficients", {})
-
-    def objective_func(x_array):
-        x_dict = {name: x_array[i] for i, name in enumerate(var_names)}
-        return sum(obj_coeffs.get(name, 0) * x_dict[name] for name in var_names)
+    obj_vec = np.array([obj_coeffs.get(name, 0.0) for name in var_names], dtype=np.float64)
 
     sense = ObjectiveSense.MAXIMIZE if objective["sense"] == "maximize" else ObjectiveSense.MINIMIZE
-    solver.set_objective(objective_func, sense)
+    solver.set_objective(
+        lambda x: float(obj_vec @ x),
+        sense,
+        gradient=lambda x: obj_vec
+    )
 
-    # Add constraints
+    # Constraint coefficients as one matrix (row per constraint), built once
+    # so each SLSQP evaluation is a dot product with a row
+    var_index = {name: j for j, name in enumerate(var_names)}
+    A = np.zeros((len(constraints), len(var_names)))
     for i, constraint in enumerate(constraints):
-        coeffs = constraint.get("coefficients", {})
-        rhs = constraint.get("rhs", 0)
-        con_type = constraint.get("type", "<=")
+        for name, value in constraint.get("coefficients", {}).items():
+            j = var_index.get(name)
+            if j is not None:
+                A[i, j] = value
 
-        def con_func(x_array, coeffs=coeffs, rhs=rhs):
-            x_dict = {name: x_array[i] for i, name in enumerate(var_names)}
-            lhs = sum(coeffs.get(name, 0) * x_dict[name] for name in var_names)
-            return lhs - rhs
+    # Add constraints (row and rhs bound as defaults: each lambda keeps its own;
+    # linear rows have constant Jacobians, so SLSQP needs no finite differences)
+    for i, constraint in enumerate(constraints):
+        a = A[i]
+        rhs = float(constraint.get("rhs", 0))
+        con_type = constraint.get("type", "<=")
 
         if con_type == "<=":
-            solver.add_constraint({"type": "ineq", "fun": lambda x: rhs - sum(coeffs.get(var_names[i], 0) * x[i] for i in range(len(var_names)))})
+            solver.add_constraint({
+                "type": "ineq",
+                "fun": lambda x, a=a, b=rhs: b - np.dot(a, x),
+                "jac": lambda x, g=-a: g
+            })
         elif con_type == ">=":
-            solver.add_constraint({"type": "ineq", "fun": lambda x: sum(coeffs.get(var_names[i], 0) * x[i] for i in range(len(var_names))) - rhs})
+            solver.add_constraint({
+                "type": "ineq",
+                "fun": lambda x, a=a, b=rhs: np.dot(a, x) - b,
+                "jac": lambda x, g=a: g
+            })
         elif con_type == "==":
-            solver.add_constraint({"type": "eq", "fun": con_func})
+            solver.add_constraint({
+                "type": "eq",
+                "fun": lambda x, a=a, b=rhs: np.dot(a, x) - b,
+                "jac": lambda x, g=a: g
+            })
 
     # Solve
     status = solver.solve(time_limit=time_limit, verbose=verbose)
@@ -458,20 +550,28 @@ def _create_mc_compatible_output(
     Returns:
         MC compatible output dict
     """
-    # Create assumptions for each variable
+    # Create assumptions for each variable; the same params dict backs both
+    # the assumption and its recommended_params entry (one pass, one dict)
     assumptions = []
+    recommended_assumptions = {}
     for name, value in solution.items():
+        assumption_name = f"{name}_coefficient"
+        params = {
+            "mean": value,
+            "std": abs(value) * 0.10  # 10% uncertainty
+        }
         assumptions.append({
-            "name": f"{name}_coefficient",
+            "name": assumption_name,
             "value": value,
             "distribution": {
                 "type": "normal",
-                "params": {
-                    "mean": value,
-                    "std": abs(value) * 0.10  # 10% uncertainty
-                }
+                "params": params
             }
         })
+        recommended_assumptions[assumption_name] = {
+            "distribution": "normal",
+            "params": params
+        }
 
     return {
         "decision_variables": solution,
@@ -481,13 +581,7 @@ def _create_mc_compatible_output(
         "recommended_next_tool": "validate_reasoning_confidence",
         "recommended_params": {
             "decision_context": "Custom optimization problem",
-            "assumptions": {
-                a["name"]: {
-                    "distribution": a["distribution"]["type"],
-                    "params": a["distribution"]["params"]
-                }
-                for a in assumptions
-            },
+            "assumptions": recommended_assumptions,
             "success_criteria": {
                 "threshold": objective_value * 0.90,
                 "comparison": ">="
@@ -10,8 +10,16 @@ Use cases:
 - Maximum throughput/capacity problems
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+import os
+import sys
 from typing import Dict, List, Any, Optional
 import time
+import numpy as np
+import pulp as pl
+from scipy.optimize import linear_sum_assignment
 
 from ..solvers.networkx_solver import NetworkXSolver
 from ..solvers.pulp_solver import PuLPSolver
@@ -20,6 +28,25 @@ from ..integration.monte_carlo import MonteCarloIntegration
 from ..integration.data_converters import DataConverter
 
 
+@dataclass(slots=True)
+class _EdgeRecord:
+    """Processed edge properties (after Monte Carlo cost overrides)."""
+    name: str
+    source: str
+    target: str
+    cost: float
+    capacity: Optional[float]
+
+
+@dataclass(slots=True)
+class _AssignmentProblem:
+    """Unit bipartite assignment as a worker x task cost matrix."""
+    workers: List[str]
+    tasks: List[str]
+    costs: np.ndarray      # inf where there is no usable edge
+    edge_at: np.ndarray    # edge position per (worker, task), -1 if none
+
+
 def optimize_network_flow(
     network: Dict[str, Any],
     flow_type: str = "min_cost",
@@ -48,21 +75,34 @@ def optimize_network_flow(
         monte_carlo_integration: Optional MC integration:
                                 - {"mode": "percentile|expected|scenarios",
                                    "percentile": "p50",  # if mode=percentile
+                                   "max_scenarios": 100,  # if mode=scenarios
+                                   "parallel_threads": 0, # if mode=scenarios (0 = all cores)
                                    "mc_output": {...}}    # MC simulation result
+                                In scenarios mode the main solve uses expected
+                                costs; cost objectives are then re-solved once
+                                per MC scenario (see scenario_analysis)
         solver_options: Optional solver settings:
-                       - {"time_limit": 300, "verbose": False, "solver": "networkx|pulp"}
+                       - {"time_limit": 300, "verbose": False, "solver": "networkx|pulp",
+                          "emit_mc_compatible": True, "max_bottlenecks": 50}
+                       emit_mc_compatible=False skips building the
+                       monte_carlo_compatible output (O(E) per call);
+                       max_bottlenecks keeps only the most utilized
+                       bottleneck edges (default: all)
 
     Returns:
         Dict with:
         - status: "optimal", "infeasible", "error"
-        - solver: "networkx" or "pulp"
+        - solver: "networkx", "pulp", or "scipy" (unit bipartite assignment)
         - solve_time_seconds: Execution time
         - flow_solution: Dict of {edge_name: flow_amount}
         - total_cost: Total cost (for min_cost)
         - total_flow: Total flow (for max_flow)
-        - bottlenecks: List of edges at capacity
+        - bottlenecks: List of edges at capacity (highest utilization first)
         - node_balance: Flow balance at each node
-        - monte_carlo_compatible: MC validation-ready output
+        - monte_carlo_compatible: MC validation-ready output (unless disabled)
+        - scenario_analysis: Per-scenario cost statistics, mean edge flows and
+          bottleneck frequencies (scenarios mode with a cost objective, when
+          mc_output carries scenarios)
 
     Example:
         result = optimize_network_flow(
@@ -94,6 +134,12 @@ def optimize_network_flow(
     time_limit = solver_opts.get("time_limit", None)
     verbose = solver_opts.get("verbose", False)
     solver_preference = solver_opts.get("solver", None)  # "networkx" or "pulp"
+    emit_mc_compatible = solver_opts.get("emit_mc_compatible", True)
+    max_bottlenecks = solver_opts.get("max_bottlenecks", None)
+
+    # Resolve edge variable names once (MC processing keeps the edge order, so
+    # they also line up with costs_data)
+    edge_names = _resolve_edge_names(network.get("edges", []))
 
     # Process Monte Carlo integration (extract values from MC output)
     costs_data = network.get("edges", [])
@@ -101,41 +147,116 @@ def optimize_network_flow(
         costs_data = _process_mc_integration(
             network,
             monte_carlo_integration,
+            edge_names,
             verbose
         )
 
-    # Check if we should use NetworkX or PuLP
-    use_networkx = _should_use_networkx(network, constraints, solver_preference, verbose)
+    # Edge records every solver path below reads (MC costs applied). Node ids
+    # key every bucket/index below; interned here and wherever node ids are
+    # read, those lookups hit on identity instead of comparing strings
+    edges = [
+        _EdgeRecord(
+            name=name,
+            source=_intern_id(edge["from"]),
+            target=_intern_id(edge["to"]),
+            cost=edge.get("cost", 0.0),
+            capacity=edge.get("capacity", None)
+        )
+        for edge, name in zip(costs_data, edge_names)
+    ]
+
+    # Unit bipartite assignment (no solver preference, no side constraints):
+    # solved directly by linear_sum_assignment instead of a min-cost flow
+    assignment = None
+    if flow_type == "assignment" and solver_preference is None and not constraints:
+        assignment = _build_assignment_problem(network, edges)
 
-    if use_networkx:
+    if assignment is not None:
+        if verbose:
+            print("Using SciPy linear_sum_assignment (unit bipartite assignment)")
+        result = _solve_assignment_with_scipy(
+            assignment,
+            network,
+            edges,
+            max_bottlenecks
+        )
+
+    # Check if we should use NetworkX or PuLP
+    elif _should_use_networkx(network, constraints, solver_preference, verbose):
         result = _solve_with_networkx(
             network,
-            costs_data,
+            edges,
             flow_type,
             time_limit,
-            verbose
+            verbose,
+            max_bottlenecks
         )
     else:
         result = _solve_with_pulp_fallback(
             network,
-            costs_data,
+            edges,
             flow_type,
             time_limit,
-            verbose
+            verbose,
+            max_bottlenecks
         )
 
+    # Scenarios mode: re-solve the same model once per MC cost scenario
+    if (
+        monte_carlo_integration
+        and monte_carlo_integration.get("mode") == "scenarios"
+        and flow_type != "max_flow"
+        and result.get("is_feasible", False)
+    ):
+        scenario_costs = _extract_scenario_costs(monte_carlo_integration, edges)
+        if scenario_costs:
+            result["scenario_analysis"] = _solve_cost_scenarios(
+                network,
+                edges,
+                flow_type,
+                result["solver"],
+                scenario_costs,
+                time_limit,
+                monte_carlo_integration.get("parallel_threads", 0)
+            )
+
     # Add Monte Carlo compatible output
-    if result.get("is_feasible", False):
+    if emit_mc_compatible and result.get("is_feasible", False):
         mc_output = _create_mc_compatible_output(
             result,
             flow_type,
-            network
+            edges
         )
         result["monte_carlo_compatible"] = mc_output
 
     return result
 
 
+def _intern_id(node_id: Any) -> Any:
+    """Interned node id (non-string ids are returned unchanged)."""
+    return sys.intern(node_id) if isinstance(node_id, str) else node_id
+
+
+def _resolve_edge_names(edges: List[Dict[str, Any]]) -> List[str]:
+    """
+    Variable name of each edge: its "name", or "flow_<from>_<to>".
+
+    Args:
+        edges: Edge list
+
+    Returns:
+        Edge names, in edge order
+    """
+    return [
+        edge["name"] if "name" in edge else f"flow_{edge['from']}_{edge['to']}"
+        for edge in edges
+    ]
+
+
+# Explicit solver_preference -> whether NetworkX is used
+_SOLVER_PREFERENCES = {"pulp": False, "networkx": True}
+
+
 def _should_use_networkx(
     network: Dict[str, Any],
     constraints: Optional[List[Dict[str, Any]]],
@@ -159,24 +280,21 @@ def _should_use_networkx(
     Returns:
         True if NetworkX should be used, False for PuLP fallback
     """
-    # Explicit solver preference
-    if solver_preference == "pulp":
+    # Explicit solver preference (decided without inspecting the network)
+    use_networkx = _SOLVER_PREFERENCES.get(solver_preference)
+    if use_networkx is not None:
         if verbose:
-            print("Using PuLP solver (user preference)")
-        return False
-    if solver_preference == "networkx":
-        if verbose:
-            print("Using NetworkX solver (user preference)")
-        return True
+            print(f"Using {'NetworkX' if use_networkx else 'PuLP'} solver (user preference)")
+        return use_networkx
 
     # Check for side constraints (require PuLP)
-    if constraints and len(constraints) > 0:
+    if constraints:
         if verbose:
             print("Using PuLP solver (side constraints present)")
         return False
 
     # Check network size (NetworkX best for <5000 edges)
-    num_edges = len(network.get("edges", []))
+    num_edges = len(network.get("edges", ()))
     if num_edges > 5000:
         if verbose:
             print(f"Using PuLP solver (large network: {num_edges} edges)")
@@ -191,6 +309,7 @@ def _should_use_networkx(
 def _process_mc_integration(
     network: Dict[str, Any],
     mc_integration: Dict[str, Any],
+    edge_names: List[str],
     verbose: bool = False
 ) -> List[Dict[str, Any]]:
     """
@@ -199,15 +318,17 @@ def _process_mc_integration(
     Args:
         network: Original network specification
         mc_integration: MC integration settings
+        edge_names: Edge names (from _resolve_edge_names)
         verbose: Print processing info
 
     Returns:
-        Updated edge list with costs from MC output
+        Edge list with costs from MC output (the input edges are not modified;
+        only edges whose cost changes are copied)
     """
     mode = mc_integration.get("mode", "percentile")
     mc_output = mc_integration.get("mc_output", {})
 
-    edges = network.get("edges", [])[:]  # Copy
+    edges = network.get("edges", [])
 
     if mode == "percentile":
         percentile = mc_integration.get("percentile", "p50")
@@ -233,58 +354,309 @@ def _process_mc_integration(
         raise ValueError(f"Unknown MC integration mode: '{mode}'")
 
     # Update edge costs with MC values
-    for edge in edges:
-        edge_name = edge.get("name", f"flow_{edge['from']}_{edge['to']}")
-        if edge_name in costs:
-            edge["cost"] = costs[edge_name]
+    if not any(edge_name in costs for edge_name in edge_names):
+        return edges
+
+    return [
+        {**edge, "cost": costs[edge_name]} if edge_name in costs else edge
+        for edge, edge_name in zip(edges, edge_names)
+    ]
+
+
+def _extract_scenario_costs(
+    mc_integration: Dict[str, Any],
+    edges: List[_EdgeRecord]
+) -> List[Dict[str, float]]:
+    """
+    Extract per-scenario edge costs from MC output (scenarios mode).
+
+    Args:
+        mc_integration: MC integration settings ("max_scenarios", default 100)
+        edges: Edge records
+
+    Returns:
+        Edge name -> cost for each scenario, empty if mc_output has no
+        scenarios or none of them prices an edge
+    """
+    try:
+        scenarios = MonteCarloIntegration.extract_all_scenarios(
+            mc_integration.get("mc_output", {}),
+            [edge.name for edge in edges]
+        )
+    except ValueError:
+        return []
+
+    scenarios = scenarios[:mc_integration.get("max_scenarios", 100)]
+    if not any(scenarios):
+        return []
+
+    return scenarios
+
+
+def _solve_cost_scenarios(
+    network: Dict[str, Any],
+    edges: List[_EdgeRecord],
+    flow_type: str,
+    solver_name: str,
+    scenario_costs: List[Dict[str, float]],
+    time_limit: Optional[float],
+    parallel_threads: int = 0
+) -> Dict[str, Any]:
+    """
+    Re-solve the network once per cost scenario and summarize the results.
+
+    Scenarios are independent, so they run on a thread pool. Each one is
+    solved as an LP with PuLP (the CBC subprocess runs outside the GIL),
+    or with linear_sum_assignment if that solved the main problem; NetworkX's
+    network simplex is not used here because it may not terminate on the
+    non-integer costs MC scenarios carry.
+
+    Args:
+        network: Network specification
+        edges: Edge records (expected costs)
+        flow_type: "min_cost" or "assignment"
+        solver_name: Solver used for the main solve ("networkx", "pulp", "scipy")
+        scenario_costs: Edge name -> cost for each scenario
+        time_limit: Solver time limit per scenario
+        parallel_threads: Worker count (0 = all cores)
+
+    Returns:
+        Dict with scenario counts, total-cost statistics, mean flow per edge
+        and the fraction of feasible scenarios in which each edge is a bottleneck
+    """
+    def solve(costs: Dict[str, float]) -> Dict[str, Any]:
+        scenario_edges = [
+            replace(edge, cost=costs[edge.name]) if edge.name in costs else edge
+            for edge in edges
+        ]
+        if solver_name == "scipy":
+            return _solve_assignment_with_scipy(
+                _build_assignment_problem(network, scenario_edges),
+                network,
+                scenario_edges
+            )
+        return _solve_with_pulp_fallback(network, scenario_edges, flow_type, time_limit, False)
+
+    threads = parallel_threads or os.cpu_count() or 1
+    threads = min(threads, len(scenario_costs))
+
+    if threads <= 1:
+        results = list(map(solve, scenario_costs))
+    else:
+        # map() yields in submission order, so output is deterministic
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(solve, scenario_costs))
+
+    feasible = [r for r in results if r.get("is_feasible", False)]
+    analysis = {
+        "num_scenarios": len(results),
+        "num_feasible": len(feasible)
+    }
+    if not feasible:
+        return analysis
+
+    total_costs = np.array([r["total_cost"] for r in feasible], dtype=np.float64)
+    flows = np.array(
+        [[r["flow_solution"].get(edge.name, 0.0) for edge in edges] for r in feasible],
+        dtype=np.float64
+    )
+
+    bottleneck_counts = defaultdict(int)
+    for r in feasible:
+        for bottleneck in r["bottlenecks"]:
+            bottleneck_counts[bottleneck["edge"]] += 1
+
+    analysis["total_cost"] = {
+        "mean": float(total_costs.mean()),
+        "std": float(total_costs.std()),
+        "min": float(total_costs.min()),
+        "max": float(total_costs.max()),
+        "p10": float(np.percentile(total_costs, 10)),
+        "p50": float(np.percentile(total_costs, 50)),
+        "p90": float(np.percentile(total_costs, 90))
+    }
+    analysis["mean_flow"] = dict(zip((edge.name for edge in edges), flows.mean(axis=0).tolist()))
+    analysis["bottleneck_frequency"] = {
+        name: count / len(feasible) for name, count in bottleneck_counts.items()
+    }
+
+    return analysis
 
-    return edges
+
+def _build_assignment_problem(
+    network: Dict[str, Any],
+    edges: List[_EdgeRecord]
+) -> Optional[_AssignmentProblem]:
+    """
+    Detect a unit bipartite assignment and build its cost matrix.
+
+    The network qualifies when every node is either a worker (supply 1) or a
+    task (demand 1), and every edge runs from a worker to a task with
+    capacity of at least 1 (capacity-0 edges are ignored), at most one edge
+    per pair.
+
+    Args:
+        network: Network specification
+        edges: Edge records
+
+    Returns:
+        The assignment problem, or None if the network is not of this form
+    """
+    workers = {}
+    tasks = {}
+    for node in network.get("nodes", []):
+        node_id = _intern_id(node["id"])
+        if node_id in workers or node_id in tasks:
+            return None
+
+        supply = node.get("supply", 0)
+        demand = node.get("demand", 0)
+        if supply == 1 and demand == 0:
+            workers[node_id] = len(workers)
+        elif demand == 1 and supply == 0:
+            tasks[node_id] = len(tasks)
+        else:
+            return None
+
+    if not workers or len(workers) != len(tasks):
+        return None
+
+    costs = np.full((len(workers), len(tasks)), np.inf)
+    edge_at = np.full((len(workers), len(tasks)), -1, dtype=np.int64)
+    for k, edge in enumerate(edges):
+        i = workers.get(edge.source)
+        j = tasks.get(edge.target)
+        if i is None or j is None or edge_at[i, j] >= 0:
+            return None
+
+        if edge.capacity is not None and edge.capacity < 1:
+            if edge.capacity == 0:
+                continue
+            return None
+
+        costs[i, j] = edge.cost
+        edge_at[i, j] = k
+
+    return _AssignmentProblem(list(workers), list(tasks), costs, edge_at)
+
+
+def _solve_assignment_with_scipy(
+    problem: _AssignmentProblem,
+    network: Dict[str, Any],
+    edges: List[_EdgeRecord],
+    max_bottlenecks: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Solve a unit bipartite assignment with scipy's linear_sum_assignment.
+
+    Args:
+        problem: Assignment problem (from _build_assignment_problem)
+        network: Network specification
+        edges: Edge records
+        max_bottlenecks: Keep at most this many bottlenecks (None = all)
+
+    Returns:
+        Result dictionary (same fields as the NetworkX path)
+    """
+    start_time = time.time()
+    try:
+        rows, cols = linear_sum_assignment(problem.costs)
+        status = OptimizationStatus.OPTIMAL
+    except ValueError:
+        # No perfect matching over the available edges
+        status = OptimizationStatus.INFEASIBLE
+    solve_time = time.time() - start_time
+
+    # Build result
+    result = {
+        "solver": "scipy",
+        "status": status.value,
+        "is_optimal": status == OptimizationStatus.OPTIMAL,
+        "is_feasible": status == OptimizationStatus.OPTIMAL,
+        "solve_time_seconds": solve_time
+    }
+
+    if status != OptimizationStatus.OPTIMAL:
+        result["message"] = _generate_network_infeasibility_message(
+            status.value,
+            network
+        )
+        return result
+
+    chosen = [edges[k] for k in problem.edge_at[rows, cols].tolist()]
+
+    flow_solution = dict.fromkeys((edge.name for edge in edges), 0)
+    for edge in chosen:
+        flow_solution[edge.name] = 1
+    result["flow_solution"] = flow_solution
+    result["total_cost"] = sum(edge.cost for edge in chosen)
+
+    # Bottlenecks: assigned edges whose capacity the single unit fills
+    result["bottlenecks"] = [
+        {
+            'edge': edge.name,
+            'from': edge.source,
+            'to': edge.target,
+            'capacity': edge.capacity,
+            'flow': 1,
+            'utilization': 1 / edge.capacity
+        }
+        for edge in chosen
+        if edge.capacity is not None and 1 / edge.capacity >= 0.99
+    ][:max_bottlenecks]
+
+    # Node balance: each worker sends one unit, each task receives one
+    node_balance = {}
+    for worker in problem.workers:
+        node_balance[worker] = {'inflow': 0, 'outflow': 1, 'net': -1}
+    for task in problem.tasks:
+        node_balance[task] = {'inflow': 1, 'outflow': 0, 'net': 1}
+    result["node_balance"] = node_balance
+
+    return result
 
 
 def _solve_with_networkx(
     network: Dict[str, Any],
-    costs_data: List[Dict[str, Any]],
+    edges: List[_EdgeRecord],
     flow_type: str,
     time_limit: Optional[float],
-    verbose: bool
+    verbose: bool,
+    max_bottlenecks: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Solve network flow problem using NetworkX algorithms.
 
     Args:
         network: Network specification
-        costs_data: Edge list (possibly updated with MC costs)
+        edges: Edge records
         flow_type: "min_cost", "max_flow", or "assignment"
         time_limit: Solver time limit
         verbose: Print solver output
+        max_bottlenecks: Keep at most this many bottlenecks (None = all)
 
     Returns:
         Result dictionary
     """
+    # Flow-type branches, decided once
+    is_cost_objective = flow_type in ("min_cost", "assignment")
+    is_max_flow = flow_type == "max_flow"
+
     solver = NetworkXSolver()
 
     # Create variables (edges)
-    edges = costs_data if costs_data else network.get("edges", [])
-    edge_names = []
     edge_bounds = {}
 
     for edge in edges:
-        from_node = edge["from"]
-        to_node = edge["to"]
-        capacity = edge.get("capacity", None)
-        cost = edge.get("cost", 0.0)
-        name = edge.get("name", f"flow_{from_node}_{to_node}")
-
-        edge_names.append(name)
-        edge_bounds[name] = {
-            'from': from_node,  # Explicit edge endpoints
-            'to': to_node,
-            'capacity': capacity if capacity is not None else float('inf'),
-            'cost': cost
+        edge_bounds[edge.name] = {
+            'from': edge.source,  # Explicit edge endpoints
+            'to': edge.target,
+            'capacity': edge.capacity if edge.capacity is not None else float('inf'),
+            'cost': edge.cost
         }
 
     solver.create_variables(
-        names=edge_names,
+        names=[edge.name for edge in edges],
         var_type="continuous",
         bounds=edge_bounds
     )
@@ -292,12 +664,12 @@ def _solve_with_networkx(
     # Set objective
     solver.set_objective(
         expression={'type': flow_type},
-        sense=ObjectiveSense.MINIMIZE if flow_type != "max_flow" else ObjectiveSense.MAXIMIZE
+        sense=ObjectiveSense.MAXIMIZE if is_max_flow else ObjectiveSense.MINIMIZE
     )
 
     # Add node balance constraints
     for node in network.get("nodes", []):
-        node_id = node["id"]
+        node_id = _intern_id(node["id"])
         supply = node.get("supply", 0.0)
         demand = node.get("demand", 0.0)
 
@@ -325,16 +697,16 @@ def _solve_with_networkx(
 
         result["flow_solution"] = solution
 
-        if flow_type in ["min_cost", "assignment"]:
+        if is_cost_objective:
             result["total_cost"] = objective_value
-        elif flow_type == "max_flow":
+        elif is_max_flow:
             result["total_flow"] = objective_value
         else:
             # Fallback
             result["objective_value"] = objective_value
 
         # Add bottleneck analysis
-        bottlenecks = solver.get_bottlenecks(tolerance=0.01)
+        bottlenecks = solver.get_bottlenecks(tolerance=0.01, limit=max_bottlenecks)
         result["bottlenecks"] = bottlenecks
 
         # Add node balance
@@ -353,10 +725,11 @@ def _solve_with_networkx(
 
 def _solve_with_pulp_fallback(
     network: Dict[str, Any],
-    costs_data: List[Dict[str, Any]],
+    edges: List[_EdgeRecord],
     flow_type: str,
     time_limit: Optional[float],
-    verbose: bool
+    verbose: bool,
+    max_bottlenecks: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Solve network flow using PuLP as general LP.
@@ -366,31 +739,50 @@ def _solve_with_pulp_fallback(
 
     Args:
         network: Network specification
-        costs_data: Edge list
+        edges: Edge records
         flow_type: Problem type
         time_limit: Solver time limit
         verbose: Print solver output
+        max_bottlenecks: Keep at most this many bottlenecks (None = all)
 
     Returns:
         Result dictionary
     """
-    import pulp as pl
+    # Flow-type branches, decided once
+    is_cost_objective = flow_type in ("min_cost", "assignment")
+    is_max_flow = flow_type == "max_flow"
 
     solver = PuLPSolver(problem_name=f"network_flow_{flow_type}")
 
-    # Create variables for edge flows
-    edges = costs_data if costs_data else network.get("edges", [])
-    edge_vars = {}
+    nodes = network.get("nodes", [])
 
-    for edge in edges:
-        from_node = edge["from"]
-        to_node = edge["to"]
-        capacity = edge.get("capacity", None)
-        name = edge.get("name", f"flow_{from_node}_{to_node}")
+    # Node id -> position (endpoints outside the node list map to a spare index)
+    node_index = {}
+    for node in nodes:
+        node_index.setdefault(_intern_id(node["id"]), len(node_index))
+    spare = len(node_index)
 
-        upper_bound = capacity if capacity is not None else None
-        edge_vars[name] = (0, upper_bound)
+    # Single ingestion pass over the edges. Everything below reads these:
+    # variable bounds and costs, edge names bucketed by endpoint (so
+    # conservation rows take O(N + E), not O(N * E)), and the capacity and
+    # endpoint-index columns for the post-solve analysis
+    edge_vars = {}
+    edge_costs = {}
+    incoming = defaultdict(list)
+    outgoing = defaultdict(list)
+    capacity_column = []
+    from_column = []
+    to_column = []
+    for edge in edges:
+        edge_vars[edge.name] = (0, edge.capacity)
+        edge_costs[edge.name] = edge.cost
+        incoming[edge.target].append(edge.name)
+        outgoing[edge.source].append(edge.name)
+        capacity_column.append(np.nan if edge.capacity is None else edge.capacity)
+        from_column.append(node_index.get(edge.source, spare))
+        to_column.append(node_index.get(edge.target, spare))
 
+    # Create variables for edge flows
     variables = solver.create_variables(
         names=list(edge_vars.keys()),
         var_type="continuous",
@@ -398,63 +790,51 @@ def _solve_with_pulp_fallback(
     )
 
     # Set objective
-    if flow_type == "min_cost":
-        # Minimize total cost
-        coefficients = {
-            edge.get("name", f"flow_{edge['from']}_{edge['to']}"): edge.get("cost", 0.0)
-            for edge in edges
-        }
-        obj_expr = pl.lpSum([
-            coefficients[name] * variables[name]
-            for name in variables
-        ])
+    if is_cost_objective:
+        # Minimize total cost (one expression from the variable -> cost dict,
+        # instead of summing a product expression per edge)
+        obj_expr = pl.LpAffineExpression({
+            variables[name]: cost for name, cost in edge_costs.items()
+        })
         solver.set_objective(obj_expr, ObjectiveSense.MINIMIZE)
 
-    elif flow_type == "max_flow":
+    elif is_max_flow:
         # Maximize total flow from sources
         # Find source nodes (supply > 0)
-        sources = [node for node in network.get("nodes", []) if node.get("supply", 0) > 0]
-        source_ids = {node["id"] for node in sources}
+        # (ordered and de-duplicated, so the objective is built deterministically)
+        source_ids = dict.fromkeys(
+            _intern_id(node["id"]) for node in network.get("nodes", []) if node.get("supply", 0) > 0
+        )
 
-        # Sum of outflow from sources
-        flow_expr = pl.lpSum([
-            variables[name]
-            for edge in edges
-            if edge["from"] in source_ids
-            for name in [edge.get("name", f"flow_{edge['from']}_{edge['to']}")]
-            if name in variables
-        ])
-        solver.set_objective(flow_expr, ObjectiveSense.MAXIMIZE)
+        # Sum of outflow from sources, read from the endpoint buckets rather
+        # than scanning every edge
+        flow_terms = defaultdict(int)
+        for source_id in source_ids:
+            for name in outgoing.get(source_id, ()):
+                flow_terms[variables[name]] += 1
+        solver.set_objective(pl.LpAffineExpression(flow_terms), ObjectiveSense.MAXIMIZE)
 
-    # Add flow conservation constraints
-    nodes = network.get("nodes", [])
+    # Add flow conservation constraints (collected, then added in one batch)
+    conservation = []
     for node in nodes:
-        node_id = node["id"]
+        node_id = _intern_id(node["id"])
         supply = node.get("supply", 0.0)
         demand = node.get("demand", 0.0)
 
-        # Inflow
-        inflow = pl.lpSum([
-            variables[edge.get("name", f"flow_{edge['from']}_{edge['to']}")]
-            for edge in edges
-            if edge["to"] == node_id
-            and edge.get("name", f"flow_{edge['from']}_{edge['to']}") in variables
-        ])
-
-        # Outflow
-        outflow = pl.lpSum([
-            variables[edge.get("name", f"flow_{edge['from']}_{edge['to']}")]
-            for edge in edges
-            if edge["from"] == node_id
-            and edge.get("name", f"flow_{edge['from']}_{edge['to']}") in variables
-        ])
+        # Inflow (+1) and outflow (-1) coefficients, merged per variable
+        terms = defaultdict(int)
+        for name in incoming.get(node_id, ()):
+            terms[variables[name]] += 1
+        for name in outgoing.get(node_id, ()):
+            terms[variables[name]] -= 1
 
         # Flow conservation: inflow - outflow = demand - supply
         net_demand = demand - supply
-        solver.add_constraint(
-            inflow - outflow == net_demand,
-            name=f"flow_conservation_{node_id}"
-        )
+        conservation.append((
+            f"flow_conservation_{node_id}",
+            pl.LpAffineExpression(terms) == net_demand
+        ))
+    solver.add_constraints(conservation)
 
     # Solve
     status = solver.solve(time_limit=time_limit, verbose=verbose)
@@ -474,54 +854,58 @@ def _solve_with_pulp_fallback(
 
         result["flow_solution"] = solution
 
-        if flow_type in ["min_cost", "assignment"]:
+        if is_cost_objective:
             result["total_cost"] = objective_value
-        elif flow_type == "max_flow":
+        elif is_max_flow:
             result["total_flow"] = objective_value
         else:
             # Fallback
             result["objective_value"] = objective_value
 
-        # Calculate bottlenecks
-        bottlenecks = []
-        for edge in edges:
-            name = edge.get("name", f"flow_{edge['from']}_{edge['to']}")
-            if name in solution:
-                flow = solution[name]
-                capacity = edge.get("capacity")
-                if capacity is not None and flow > 0:
-                    utilization = flow / capacity
-                    if utilization >= 0.99:
-                        bottlenecks.append({
-                            'edge': name,
-                            'from': edge['from'],
-                            'to': edge['to'],
-                            'capacity': capacity,
-                            'flow': flow,
-                            'utilization': utilization
-                        })
-        result["bottlenecks"] = sorted(bottlenecks, key=lambda x: x['utilization'], reverse=True)
-
-        # Calculate node balance
-        node_balance = {}
-        for node in nodes:
-            node_id = node["id"]
-            inflow = sum(
-                solution.get(edge.get("name", f"flow_{edge['from']}_{edge['to']}"), 0)
-                for edge in edges
-                if edge["to"] == node_id
-            )
-            outflow = sum(
-                solution.get(edge.get("name", f"flow_{edge['from']}_{edge['to']}"), 0)
-                for edge in edges
-                if edge["from"] == node_id
-            )
-            node_balance[node_id] = {
-                'inflow': inflow,
-                'outflow': outflow,
-                'net': inflow - outflow
+        # Calculate bottlenecks: flows and capacities as parallel arrays
+        # (uncapacitated edges as NaN, so they never pass the test)
+        flows = np.fromiter(
+            (solution.get(edge.name, 0.0) for edge in edges), dtype=np.float64, count=len(edges)
+        )
+        capacities = np.array(capacity_column, dtype=np.float64)
+        utilization = np.divide(
+            flows, capacities, out=np.full(len(edges), np.nan), where=flows > 0
+        )
+        with np.errstate(invalid="ignore"):
+            at_capacity = np.flatnonzero(utilization >= 0.99)
+        # Highest utilization first (stable: ties keep edge order)
+        at_capacity = at_capacity[np.argsort(-utilization[at_capacity], kind="stable")]
+        at_capacity = at_capacity[:max_bottlenecks]
+
+        result["bottlenecks"] = [
+            {
+                'edge': edges[k].name,
+                'from': edges[k].source,
+                'to': edges[k].target,
+                'capacity': edges[k].capacity,
+                'flow': solution[edges[k].name],
+                'utilization': float(utilization[k])
             }
-        result["node_balance"] = node_balance
+            for k in at_capacity.tolist()
+        ]
+
+        # Calculate node balance: edge flows summed per endpoint index in one
+        # bincount each (endpoints outside the node list go to the spare bin)
+        inflows = np.bincount(
+            np.array(to_column, dtype=np.int64), weights=flows, minlength=spare + 1
+        ).tolist()
+        outflows = np.bincount(
+            np.array(from_column, dtype=np.int64), weights=flows, minlength=spare + 1
+        ).tolist()
+
+        result["node_balance"] = {
+            node_id: {
+                'inflow': inflows[k],
+                'outflow': outflows[k],
+                'net': inflows[k] - outflows[k]
+            }
+            for node_id, k in node_index.items()
+        }
 
     else:
         result["message"] = _generate_network_infeasibility_message(
@@ -538,8 +922,12 @@ def _generate_network_infeasibility_message(
 ) -> str:
     """Generate helpful infeasibility message."""
     if status == "infeasible":
-        total_supply = sum(node.get("supply", 0) for node in network.get("nodes", []))
-        total_demand = sum(node.get("demand", 0) for node in network.get("nodes", []))
+        # Both totals in one pass over the nodes
+        total_supply = 0
+        total_demand = 0
+        for node in network.get("nodes", ()):
+            total_supply += node.get("supply", 0)
+            total_demand += node.get("demand", 0)
 
         return (
             f"Network flow problem is infeasible. "
@@ -556,7 +944,7 @@ def _generate_network_infeasibility_message(
 def _create_mc_compatible_output(
     result: Dict[str, Any],
     flow_type: str,
-    network: Dict[str, Any]
+    edges: List[_EdgeRecord]
 ) -> Dict[str, Any]:
     """
     Create Monte Carlo compatible output for validation.
@@ -564,33 +952,40 @@ def _create_mc_compatible_output(
     Args:
         result: Optimization result
         flow_type: Problem type
-        network: Original network
+        edges: Edge records with the costs that were optimized
 
     Returns:
         MC compatible output dictionary
     """
     flow_solution = result.get("flow_solution", {})
 
-    # Create uncertainty assumptions (treat costs as uncertain)
+    # Create uncertainty assumptions (treat costs as uncertain), together with
+    # their recommended_params form in the same pass; both share one
+    # (read-only) params dict per edge
     assumptions = []
-    edges = network.get("edges", [])
+    recommended_assumptions = {}
 
     for edge in edges:
-        edge_name = edge.get("name", f"flow_{edge['from']}_{edge['to']}")
-        cost = edge.get("cost", 0.0)
+        cost = edge.cost
 
         if cost > 0:  # Only include edges with costs
+            name = f"{edge.name}_cost"
+            params = {
+                "mean": cost,
+                "std": cost * 0.10  # 10% standard deviation
+            }
             assumptions.append({
-                "name": f"{edge_name}_cost",
+                "name": name,
                 "value": cost,
                 "distribution": {
                     "type": "normal",
-                    "params": {
-                        "mean": cost,
-                        "std": cost * 0.10  # 10% standard deviation
-                    }
+                    "params": params
                 }
             })
+            recommended_assumptions[name] = {
+                "distribution": "normal",
+                "params": params
+            }
 
     # Describe outcome function
     total_cost = result.get("total_cost", result.get("total_flow", 0))
@@ -607,13 +1002,7 @@ def _create_mc_compatible_output(
         "recommended_next_tool": "validate_reasoning_confidence",
         "recommended_params": {
             "decision_context": f"Network flow optimization ({flow_type})",
-            "assumptions": {
-                a["name"]: {
-                    "distribution": a["distribution"]["type"],
-                    "params": a["distribution"]["params"]
-                }
-                for a in assumptions
-            },
+            "assumptions": recommended_assumptions,
             "success_criteria": {
                 "threshold": total_cost * (0.9 if flow_type == "min_cost" else 1.1),
                 "comparison": "<=" if flow_type == "min_cost" else ">="
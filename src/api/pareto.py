@@ -252,6 +252,16 @@ def _generate_pareto_frontier(
     if verbose:
         print(f"\nGenerating Pareto frontier with {len(weight_combinations)} points...")
 
+    # Variables and constraints are the same for every weight combination:
+    # build the model once and swap only the objective per point
+    model = _build_base_model(
+        objectives,
+        objective_values,
+        resources,
+        item_requirements,
+        constraints
+    )
+
     # Solve for each weight combination
     for weight_idx, weights in enumerate(weight_combinations):
         if verbose and weight_idx % 5 == 0:
@@ -259,12 +269,9 @@ def _generate_pareto_frontier(
 
         # Create weighted objective
         result_point = _solve_weighted_scalarization(
+            model,
             objectives,
             weights,
-            objective_values,
-            resources,
-            item_requirements,
-            constraints,
             time_limit,
             verbose=False  # Don't print for each point
         )
@@ -282,21 +289,27 @@ def _generate_pareto_frontier(
     return frontier_points
 
 
-def _solve_weighted_scalarization(
+def _build_base_model(
     objectives: List[Dict[str, Any]],
-    weights: List[float],
     objective_values: Dict[str, Dict[str, float]],
     resources: Dict[str, Dict[str, float]],
     item_requirements: List[Dict[str, Any]],
-    constraints: Optional[List[Dict[str, Any]]],
-    time_limit: Optional[float],
-    verbose: bool
+    constraints: Optional[List[Dict[str, Any]]]
 ) -> Dict[str, Any]:
     """
-    Solve single weighted sum scalarization.
+    Build the scalarization model shared by all frontier points.
+
+    Args:
+        objectives: List of objectives
+        objective_values: Extracted values for each objective
+        resources: Resource constraints
+        item_requirements: Item requirements
+        constraints: Additional constraints
 
     Returns:
-        Dict with status, allocation, objective_values, weights
+        Dict with solver, variables, item_names, value_matrix (objective x
+        item values), signs (+1 maximize, -1 minimize, per objective) and
+        integral (per objective, whether all its item values are ints)
     """
     solver = PuLPSolver(problem_name="pareto_scalarization")
 
@@ -304,27 +317,31 @@ def _solve_weighted_scalarization(
     item_names = [item["name"] for item in item_requirements]
     variables = solver.create_variables(names=item_names, var_type="binary")
 
-    # Build weighted objective
-    # Normalize all objectives to MAXIMIZATION by negating minimize objectives
-    weighted_expr = 0
+    value_matrix = np.array(
+        [
+            [objective_values[objective["name"]].get(name, 0) for name in item_names]
+            for objective in objectives
+        ],
+        dtype=np.float64
+    ).reshape(len(objectives), len(item_names))
 
-    for obj_idx, objective in enumerate(objectives):
-        obj_name = objective["name"]
-        weight = weights[obj_idx]
-        values = objective_values[obj_name]
-        obj_sense = objective["sense"]
-
-        # For minimize objectives, negate the values (so we can maximize all)
-        multiplier = 1.0 if obj_sense == "maximize" else -1.0
+    # Objectives given in ints report int totals, as a Python sum would
+    integral = [
+        all(isinstance(objective_values[objective["name"]].get(name, 0), int) for name in item_names)
+        for objective in objectives
+    ]
 
-        # Add weighted contribution
-        weighted_expr += weight * multiplier * pl.lpSum([
-            values.get(item_name, 0) * variables[item_name]
-            for item_name in item_names
-        ])
+    # Normalize all objectives to MAXIMIZATION by negating minimize objectives
+    signs = np.array(
+        [1.0 if objective["sense"] == "maximize" else -1.0 for objective in objectives]
+    )
 
-    # Always maximize the weighted sum (since we normalized)
-    solver.set_objective(weighted_expr, ObjectiveSense.MAXIMIZE)
+    # Placeholder objective (every variable, zero weight); each point
+    # replaces it before solving
+    solver.set_objective(
+        pl.LpAffineExpression({variables[name]: 0 for name in item_names}),
+        ObjectiveSense.MAXIMIZE
+    )
 
     # Add resource constraints
     for resource_name, resource_spec in resources.items():
@@ -343,6 +360,52 @@ def _solve_weighted_scalarization(
         from .allocation import _add_custom_constraints
         _add_custom_constraints(solver, variables, constraints)
 
+    return {
+        "solver": solver,
+        "variables": variables,
+        "item_names": item_names,
+        "value_matrix": value_matrix,
+        "signs": signs,
+        "integral": integral
+    }
+
+
+def _solve_weighted_scalarization(
+    model: Dict[str, Any],
+    objectives: List[Dict[str, Any]],
+    weights: List[float],
+    time_limit: Optional[float],
+    verbose: bool
+) -> Dict[str, Any]:
+    """
+    Solve single weighted sum scalarization on the shared model.
+
+    Args:
+        model: Shared model (from _build_base_model)
+        objectives: List of objectives
+        weights: Weight per objective
+        time_limit: Solver time limit
+        verbose: Print solver output
+
+    Returns:
+        Dict with status, allocation, objective_values, weights
+    """
+    solver = model["solver"]
+    variables = model["variables"]
+    item_names = model["item_names"]
+    value_matrix = model["value_matrix"]
+
+    # Weighted objective coefficient per item (minimize objectives negated,
+    # so the weighted sum is always maximized)
+    coefficients = (np.asarray(weights, dtype=np.float64) * model["signs"]) @ value_matrix
+    solver.replace_objective(
+        pl.LpAffineExpression({
+            variables[name]: coefficient
+            for name, coefficient in zip(item_names, coefficients.tolist())
+        }),
+        ObjectiveSense.MAXIMIZE
+    )
+
     # Solve
     try:
         status = solver.solve(time_limit=time_limit, verbose=verbose)
@@ -357,12 +420,11 @@ def _solve_weighted_scalarization(
     allocation = {name: int(solution[name]) for name in item_names}
 
     # Calculate objective values for this solution
-    obj_values = {}
-    for objective in objectives:
-        obj_name = objective["name"]
-        values = objective_values[obj_name]
-        obj_value = sum(values.get(name, 0) * allocation[name] for name in item_names)
-        obj_values[obj_name] = obj_value
+    totals = (value_matrix @ np.fromiter(allocation.values(), dtype=np.float64, count=len(item_names))).tolist()
+    obj_values = {
+        objective["name"]: round(total) if integral else total
+        for objective, total, integral in zip(objectives, totals, model["integral"])
+    }
 
     return {
         "status": "optimal",
@@ -448,45 +510,26 @@ def _filter_dominated_solutions(
     Returns:
         Non-dominated points only
     """
-    non_dominated = []
     obj_names = [obj["name"] for obj in objectives]
     sense = objectives[0]["sense"]  # All same sense
 
-    for i, point_a in enumerate(frontier_points):
-        is_dominated = False
-
-        for j, point_b in enumerate(frontier_points):
-            if i == j:
-                continue
-
-            # Check if point_b dominates point_a
-            better_count = 0
-            worse_count = 0
-
-            for obj_name in obj_names:
-                val_a = point_a["objective_values"][obj_name]
-                val_b = point_b["objective_values"][obj_name]
-
-                if sense == "maximize":
-                    if val_b > val_a:
-                        better_count += 1
-                    elif val_b < val_a:
-                        worse_count += 1
-                else:  # minimize
-                    if val_b < val_a:
-                        better_count += 1
-                    elif val_b > val_a:
-                        worse_count += 1
-
-            # Point B dominates A if better on ≥1 objective and not worse on any
-            if better_count > 0 and worse_count == 0:
-                is_dominated = True
-                break
-
-        if not is_dominated:
-            non_dominated.append(point_a)
-
-    return non_dominated
+    # (N, K) objective matrix, negated for minimization so larger is better
+    values = np.array(
+        [[point["objective_values"][name] for name in obj_names] for point in frontier_points],
+        dtype=np.float64
+    ).reshape(len(frontier_points), len(obj_names))
+    if sense != "maximize":
+        values = -values
+
+    # Pairwise (N, N, K) comparisons, [i, j] = point j against point i:
+    # j dominates i if no worse on every objective and strictly better on at
+    # least one (a point never strictly beats itself)
+    others = values[np.newaxis, :, :]
+    own = values[:, np.newaxis, :]
+    dominates = (others >= own).all(axis=2) & (others > own).any(axis=2)
+    dominated = dominates.any(axis=1).tolist()
+
+    return [point for point, is_dominated in zip(frontier_points, dominated) if not is_dominated]
 
 
 def _analyze_tradeoffs(
@@ -9,7 +9,10 @@ Use cases:
 - Maximize return for target risk
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
+from contextlib import nullcontext
+from functools import lru_cache
+import threading
 import numpy as np
 
 try:
@@ -19,14 +22,15 @@ except ImportError:
     CVXPY_AVAILABLE = False
 
 from ..solvers.cvxpy_solver import CVXPYSolver
-from ..solvers.base_solver import ObjectiveSense
+from ..solvers.scipy_solver import SciPySolver
+from ..solvers.base_solver import BaseSolver, ObjectiveSense
 from ..integration.monte_carlo import MonteCarloIntegration
 from ..integration.data_converters import DataConverter
 
 
 def optimize_portfolio(
     assets: List[Dict[str, Any]],
-    covariance_matrix: List[List[float]],
+    covariance_matrix: Union[List[List[float]], np.ndarray],
     constraints: Optional[Dict[str, Any]] = None,
     optimization_objective: str = "sharpe",
     risk_free_rate: float = 0.02,
@@ -41,6 +45,7 @@ def optimize_portfolio(
                - [{"name": "AAPL", "expected_return": 0.12}, ...]
         covariance_matrix: N×N covariance matrix for asset returns
                           - [[var1, cov12, ...], [cov21, var2, ...], ...]
+                          - or an N×N numpy array (used without copying if float64)
         constraints: Optional portfolio constraints:
                     - max_weight: Maximum weight per asset (e.g., 0.3 = 30%)
                     - min_weight: Minimum weight per asset (e.g., 0.05 = 5%)
@@ -110,8 +115,9 @@ def optimize_portfolio(
     # Convert inputs to numpy arrays
     asset_names = [asset["name"] for asset in assets]
     n_assets = len(asset_names)
-    returns_array = np.array([expected_returns[name] for name in asset_names])
-    cov_matrix = np.array(covariance_matrix)
+    returns_array = np.array([expected_returns[name] for name in asset_names], dtype=float)
+    # Kept in float64: solver tolerances assume double precision
+    cov_matrix = np.asarray(covariance_matrix, dtype=float)
 
     # Validate covariance matrix
     if cov_matrix.shape != (n_assets, n_assets):
@@ -121,119 +127,268 @@ def optimize_portfolio(
             "message": "Covariance matrix must be N×N where N = number of assets"
         }
 
-    # Create solver
+    # Symmetrize once; the factorization, SLSQP gradient and reported metrics
+    # all use this matrix
+    cov_matrix = (cov_matrix + cov_matrix.T) / 2
+
+    # Check objective-specific requirements before building the problem
+    if optimization_objective == "min_variance" and target_return is None:
+        return {
+            "status": "error",
+            "error": "target_return required for min_variance objective",
+            "message": "Specify target_return in constraints"
+        }
+    if optimization_objective == "max_return" and target_risk is None:
+        return {
+            "status": "error",
+            "error": "target_risk required for max_return objective",
+            "message": "Specify target_risk in constraints"
+        }
+
+    # Factor covariance (Σ = F Fᵀ) so variance stays DPP-compliant as ||Fᵀw||²
+    cov_factor = _covariance_factor(cov_matrix)
+    if cov_factor is None:
+        return {
+            "status": "error",
+            "error": "Covariance matrix is not positive semidefinite",
+            "message": "Covariance matrix must be symmetric positive semidefinite"
+        }
+
+    # Long-only floors at min_weight; otherwise allow short selling within bounds
+    lower_bound = min_weight if long_only else -max_weight
+    upper_bound = max_weight
+
+    params = None
+    solve_lock = nullcontext()
+
+    if (optimization_objective == "sharpe"
+            and lower_bound * n_assets <= 1 <= upper_bound * n_assets):
+        # Only box bounds plus the budget constraint: solve directly with SLSQP
+        # and an analytic gradient, skipping CVXPY canonicalization entirely
+        solver = _build_sharpe_solver(
+            asset_names,
+            returns_array,
+            cov_matrix,
+            risk_free_rate,
+            lower_bound,
+            upper_bound
+        )
+    else:
+        # Fetch the compiled problem for this shape
+        problem = _get_parametrized_problem(tuple(asset_names), optimization_objective)
+        solver = problem["solver"]
+        params = problem["parameters"]
+        solve_lock = problem["lock"]
+
+    # The cached problem is shared across calls (and server threads): hold its
+    # lock from loading the numeric data until the solution has been read
+    with solve_lock:
+        # Load data and solve (Parameter assignment rejects malformed values)
+        try:
+            if params is not None:
+                params["returns"].value = returns_array
+                params["cov_factor"].value = cov_factor
+                params["lower"].value = np.full(n_assets, lower_bound, dtype=float)
+                params["upper"].value = np.full(n_assets, upper_bound, dtype=float)
+                if optimization_objective == "sharpe":
+                    params["risk_free_rate"].value = risk_free_rate
+                elif optimization_objective == "min_variance":
+                    params["target"].value = target_return
+                else:
+                    params["target"].value = target_risk
+
+            status = solver.solve(time_limit=time_limit, verbose=verbose)
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": str(e),
+                "message": "Solver encountered an error during portfolio optimization"
+            }
+
+        # Build result
+        result = _build_portfolio_result(
+            solver,
+            asset_names,
+            returns_array,
+            cov_matrix,
+            risk_free_rate,
+            optimization_objective
+        )
+
+    # Add Monte Carlo compatible output
+    if result["is_feasible"]:
+        mc_output = _create_mc_compatible_output(
+            result["weights"],
+            expected_returns,
+            result["expected_return"],
+            result["portfolio_variance"]
+        )
+        result["monte_carlo_compatible"] = mc_output
+
+    return result
+
+
+@lru_cache(maxsize=32)
+def _get_parametrized_problem(
+    asset_names: tuple,
+    optimization_objective: str
+) -> Dict[str, Any]:
+    """
+    Build (once per shape) a CVXPY portfolio problem driven by Parameters.
+
+    Returns, weights bounds, targets and the covariance factor are Parameters,
+    so repeat calls with the same assets and objective only swap numeric data
+    and CVXPY reuses the cached canonicalization instead of recompiling.
+
+    Args:
+        asset_names: Asset names (variable names, in order)
+        optimization_objective: "sharpe", "min_variance" or "max_return"
+
+    Returns:
+        Dict with the configured "solver", its named "parameters" and a
+        "lock" guarding them while a call loads data and solves
+    """
+    n_assets = len(asset_names)
+
     # Use "QP" for variance minimization and Sharpe, but problem_type doesn't
     # strictly enforce solver - CVXPY will auto-select appropriate solver
     solver = CVXPYSolver(problem_type="QP")
 
     # Create weight variables
     variables = solver.create_variables(
-        names=asset_names,
+        names=list(asset_names),
         var_type="continuous"
     )
 
     # Build weight vector for CVXPY
     weights = cp.hstack([variables[name] for name in asset_names])
 
-    # Add basic constraints
+    parameters = {
+        "returns": cp.Parameter(n_assets),
+        "cov_factor": cp.Parameter((n_assets, n_assets)),
+        "lower": cp.Parameter(n_assets),
+        "upper": cp.Parameter(n_assets),
+    }
+
     # Constraint 1: Weights sum to 1
     solver.add_constraint(cp.sum(weights) == 1)
 
     # Constraint 2: Weight bounds
-    for name in asset_names:
-        if long_only:
-            solver.add_constraint(variables[name] >= min_weight)
-        else:
-            # Allow short selling within bounds
-            solver.add_constraint(variables[name] >= -max_weight)
-        solver.add_constraint(variables[name] <= max_weight)
+    solver.add_constraint(weights >= parameters["lower"])
+    solver.add_constraint(weights <= parameters["upper"])
 
     # Build portfolio metrics
-    portfolio_return = returns_array @ weights
-    portfolio_variance = cp.quad_form(weights, cov_matrix)
+    portfolio_return = parameters["returns"] @ weights
+    portfolio_variance = cp.sum_squares(parameters["cov_factor"].T @ weights)
 
     # Set objective based on optimization goal
     if optimization_objective == "sharpe":
         # Maximize Sharpe ratio = (return - rf) / std
-        # Equivalent to: maximize (return - rf) subject to std = 1
-        # Or: maximize (return - rf)^2 / variance
-        # We use a simpler approach: minimize variance - lambda * return
-        # Lambda chosen to balance risk-return tradeoff
-        excess_return = portfolio_return - risk_free_rate
-
         # CVXPY doesn't handle division by sqrt well for optimization
         # Use alternative: maximize return - risk_aversion * variance
+        parameters["risk_free_rate"] = cp.Parameter()
+        excess_return = portfolio_return - parameters["risk_free_rate"]
         risk_aversion = 0.5  # Tuning parameter
-        obj_expr = excess_return - risk_aversion * portfolio_variance
-        solver.set_objective(obj_expr, ObjectiveSense.MAXIMIZE)
+        solver.set_objective(
+            excess_return - risk_aversion * portfolio_variance,
+            ObjectiveSense.MAXIMIZE
+        )
 
     elif optimization_objective == "min_variance":
         # Minimize variance subject to target return
-        if target_return is None:
-            return {
-                "status": "error",
-                "error": "target_return required for min_variance objective",
-                "message": "Specify target_return in constraints"
-            }
-
+        parameters["target"] = cp.Parameter()
         solver.set_objective(portfolio_variance, ObjectiveSense.MINIMIZE)
-        solver.add_constraint(portfolio_return >= target_return)
-
-    elif optimization_objective == "max_return":
-        # Maximize return subject to target risk
-        if target_risk is None:
-            return {
-                "status": "error",
-                "error": "target_risk required for max_return objective",
-                "message": "Specify target_risk in constraints"
-            }
+        solver.add_constraint(portfolio_return >= parameters["target"])
 
+    else:
+        # Maximize return subject to target risk (unsigned: a negative
+        # target makes the problem infeasible rather than rejecting the value)
+        parameters["target"] = cp.Parameter()
         solver.set_objective(portfolio_return, ObjectiveSense.MAXIMIZE)
-        solver.add_constraint(portfolio_variance <= target_risk)
+        solver.add_constraint(portfolio_variance <= parameters["target"])
 
-    else:
-        return {
-            "status": "error",
-            "error": f"Invalid optimization_objective: {optimization_objective}",
-            "message": "Must be 'sharpe', 'min_variance', or 'max_return'"
-        }
+    return {"solver": solver, "parameters": parameters, "lock": threading.Lock()}
 
-    # Solve
-    try:
-        status = solver.solve(time_limit=time_limit, verbose=verbose)
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e),
-            "message": "Solver encountered an error during portfolio optimization"
-        }
 
-    # Build result
-    result = _build_portfolio_result(
-        solver,
-        asset_names,
-        returns_array,
-        cov_matrix,
-        risk_free_rate,
-        optimization_objective
+def _build_sharpe_solver(
+    asset_names: List[str],
+    returns_array: np.ndarray,
+    cov_matrix: np.ndarray,
+    risk_free_rate: float,
+    lower_bound: float,
+    upper_bound: float
+) -> SciPySolver:
+    """
+    Set up the Sharpe objective as a direct SLSQP problem.
+
+    Uses the same mean-variance utility as the CVXPY formulation
+    (excess return - risk_aversion * variance) with its analytic gradient.
+
+    Args:
+        asset_names: Asset names (variable names, in order)
+        returns_array: Expected returns
+        cov_matrix: Symmetric covariance matrix
+        risk_free_rate: Risk-free rate
+        lower_bound: Lower bound for each weight
+        upper_bound: Upper bound for each weight
+
+    Returns:
+        Configured SciPySolver (not yet solved)
+    """
+    n_assets = len(asset_names)
+    risk_aversion = 0.5  # Tuning parameter (matches CVXPY formulation)
+
+    solver = SciPySolver(method="SLSQP")
+    solver.create_variables(
+        names=asset_names,
+        var_type="continuous",
+        bounds={name: (lower_bound, upper_bound) for name in asset_names}
     )
 
-    # Add Monte Carlo compatible output
-    if solver.is_feasible():
-        mc_output = _create_mc_compatible_output(
-            result["weights"],
-            expected_returns,
-            result["expected_return"],
-            result["portfolio_variance"]
-        )
-        result["monte_carlo_compatible"] = mc_output
+    # Equal weights satisfy the budget and (by the caller's check) the bounds
+    solver.set_initial_guess({name: 1.0 / n_assets for name in asset_names})
 
-    return result
+    def utility(w: np.ndarray) -> float:
+        return float(returns_array @ w - risk_free_rate - risk_aversion * (w @ cov_matrix @ w))
+
+    def utility_gradient(w: np.ndarray) -> np.ndarray:
+        # ∇(w'Σw) = 2Σw
+        return returns_array - 2 * risk_aversion * (cov_matrix @ w)
+
+    solver.set_objective(utility, ObjectiveSense.MAXIMIZE, gradient=utility_gradient)
+
+    # Weights sum to 1
+    ones = np.ones(n_assets)
+    solver.add_constraint(
+        {"type": "eq", "fun": lambda w: w.sum() - 1, "jac": lambda w: ones},
+        name="budget"
+    )
+
+    return solver
+
+
+def _covariance_factor(cov_matrix: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Factor a covariance matrix as Σ = F Fᵀ via eigendecomposition.
+
+    Args:
+        cov_matrix: Symmetric N×N covariance matrix
+
+    Returns:
+        Factor F, or None if the matrix is not positive semidefinite
+    """
+    eigvals, eigvecs = np.linalg.eigh(cov_matrix)
+
+    tolerance = 1e-8 * max(1.0, float(np.abs(eigvals).max()))
+    if eigvals.min() < -tolerance:
+        return None
+
+    return eigvecs * np.sqrt(np.clip(eigvals, 0.0, None))
 
 
 def _validate_portfolio_inputs(
     assets: List[Dict[str, Any]],
-    covariance_matrix: List[List[float]],
+    covariance_matrix: Union[List[List[float]], np.ndarray],
     optimization_objective: str
 ):
     """
@@ -258,8 +413,8 @@ def _validate_portfolio_inputs(
         if not isinstance(asset["expected_return"], (int, float)):
             raise ValueError(f"Asset {i} 'expected_return' must be numeric")
 
-    if not isinstance(covariance_matrix, list):
-        raise ValueError("Covariance matrix must be a list of lists")
+    if not isinstance(covariance_matrix, (list, np.ndarray)):
+        raise ValueError("Covariance matrix must be a list of lists or a numpy array")
 
     valid_objectives = ["sharpe", "min_variance", "max_return"]
     if optimization_objective not in valid_objectives:
@@ -319,7 +474,7 @@ def _process_asset_returns(
 
 
 def _build_portfolio_result(
-    solver: CVXPYSolver,
+    solver: BaseSolver,
     asset_names: List[str],
     returns_array: np.ndarray,
     cov_matrix: np.ndarray,
@@ -330,7 +485,7 @@ def _build_portfolio_result(
     Build comprehensive portfolio result.
 
     Args:
-        solver: Solved CVXPY solver
+        solver: Solved CVXPY or SciPy solver
         asset_names: List of asset names
         returns_array: Array of expected returns
         cov_matrix: Covariance matrix
@@ -341,7 +496,7 @@ def _build_portfolio_result(
         Portfolio result dictionary
     """
     result = {
-        "solver": "cvxpy",
+        "solver": solver.solver_name,
         "optimization_objective": optimization_objective,
         "status": solver.status.value,
         "is_optimal": solver.is_optimal(),
@@ -364,9 +519,10 @@ def _build_portfolio_result(
     # Convert to numpy array for calculations
     weights_array = np.array([weights_dict[name] for name in asset_names])
 
-    # Calculate portfolio metrics
-    expected_return = float(np.dot(returns_array, weights_array))
-    portfolio_variance = float(weights_array.T @ cov_matrix @ weights_array)
+    # Calculate portfolio metrics (Σw is reused for the risk decomposition)
+    marginal_risk = cov_matrix @ weights_array
+    expected_return = float(returns_array @ weights_array)
+    portfolio_variance = float(weights_array @ marginal_risk)
     portfolio_std = np.sqrt(portfolio_variance)
 
     result["expected_return"] = expected_return
@@ -377,26 +533,33 @@ def _build_portfolio_result(
     sharpe_ratio = (expected_return - risk_free_rate) / portfolio_std if portfolio_std > 0 else 0
     result["sharpe_ratio"] = float(sharpe_ratio)
 
-    # Add asset-level details
-    asset_details = []
-    for name in asset_names:
-        asset_details.append({
-            "name": name,
-            "weight": weights_dict[name],
-            "expected_return": float(returns_array[asset_names.index(name)]),
-            "contribution_to_return": weights_dict[name] * returns_array[asset_names.index(name)]
-        })
-    result["assets"] = asset_details
-
     # Risk contribution analysis
-    # Marginal contribution to risk = 2 * Σ @ w
-    marginal_risk = 2 * cov_matrix @ weights_array
+    # Euler decomposition: w_i * (Σw)_i sums to the portfolio variance
+    return_contribution = weights_array * returns_array
     risk_contribution = weights_array * marginal_risk
-    risk_contribution_pct = risk_contribution / portfolio_variance if portfolio_variance > 0 else np.zeros_like(risk_contribution)
+    risk_contribution_pct = (
+        100 * risk_contribution / portfolio_variance if portfolio_variance > 0
+        else np.zeros_like(risk_contribution)
+    )
 
-    for i, name in enumerate(asset_names):
-        asset_details[i]["risk_contribution"] = float(risk_contribution[i])
-        asset_details[i]["risk_contribution_pct"] = float(risk_contribution_pct[i] * 100)
+    # Add asset-level details
+    result["assets"] = [
+        {
+            "name": name,
+            "weight": weights_dict[name],
+            "expected_return": expected,
+            "contribution_to_return": contribution,
+            "risk_contribution": risk,
+            "risk_contribution_pct": risk_pct
+        }
+        for name, expected, contribution, risk, risk_pct in zip(
+            asset_names,
+            returns_array.tolist(),
+            return_contribution.tolist(),
+            risk_contribution.tolist(),
+            risk_contribution_pct.tolist()
+        )
+    ]
 
     return result
 
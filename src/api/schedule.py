@@ -9,15 +9,30 @@ Use cases:
 - Task prioritization with deadlines
 """
 
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
+import heapq
+import math
+import time
+import numpy as np
 import pulp as pl
+from scipy import sparse
 
 from ..solvers.pulp_solver import PuLPSolver
-from ..solvers.base_solver import ObjectiveSense
+from ..solvers.base_solver import ObjectiveSense, OptimizationStatus
 from ..integration.monte_carlo import MonteCarloIntegration
 from ..integration.data_converters import DataConverter
 
 
+@dataclass(slots=True)
+class _TaskRecord:
+    """Processed task properties (after Monte Carlo overrides)."""
+    duration: int
+    value: float
+    dependencies: List[str]
+    resources: Dict[str, float]
+
+
 def optimize_schedule(
     tasks: List[Dict[str, Any]],
     resources: Dict[str, Dict[str, float]],
@@ -100,6 +115,38 @@ def optimize_schedule(
 
     # Process task properties (with MC integration if provided)
     task_data = _process_task_data(tasks, monte_carlo_integration)
+    task_names = [task["name"] for task in tasks]
+
+    # Small makespan problems without temporal constraints: try list
+    # scheduling first and skip the MILP if it provably reaches the lower bound
+    if (optimization_objective == "minimize_makespan"
+            and not constraints
+            and len(task_names) <= 20):
+        start_time = time.time()
+        schedule = _list_schedule(task_names, task_data, resources, time_horizon)
+        if schedule is not None:
+            result = {
+                "solver": "list_scheduling",
+                "optimization_objective": optimization_objective,
+                "status": OptimizationStatus.OPTIMAL.value,
+                "is_optimal": True,
+                "is_feasible": True,
+                "solve_time_seconds": time.time() - start_time
+            }
+            result.update(_summarize_schedule(
+                schedule,
+                task_names,
+                task_data,
+                time_horizon,
+                resources,
+                optimization_objective
+            ))
+            result["monte_carlo_compatible"] = _create_mc_compatible_output(
+                result["schedule"],
+                task_data,
+                result["makespan"]
+            )
+            return result
 
     # Create solver
     solver = PuLPSolver(problem_name="task_scheduling")
@@ -107,10 +154,11 @@ def optimize_schedule(
     # Build task-time binary variables
     # x[task, t] = 1 if task starts at time t
     var_names = []
-    task_names = [task["name"] for task in tasks]
+    var_offsets = {}  # task -> column index of x[task, 0]
 
     for task_name in task_names:
-        task_duration = task_data[task_name]["duration"]
+        task_duration = task_data[task_name].duration
+        var_offsets[task_name] = len(var_names)
         # Task can start from time 0 to (time_horizon - duration)
         max_start = time_horizon - task_duration
         for t in range(max_start + 1):
@@ -120,6 +168,7 @@ def optimize_schedule(
         names=var_names,
         var_type="binary"
     )
+    var_list = list(variables.values())
 
     # Helper function to get variable
     def get_var(task: str, time: int) -> Any:
@@ -134,9 +183,9 @@ def optimize_schedule(
     elif optimization_objective == "maximize_value":
         # Maximize total value of completed tasks
         total_value = pl.lpSum([
-            task_data[task_name]["value"] * pl.lpSum([
+            task_data[task_name].value * pl.lpSum([
                 get_var(task_name, t)
-                for t in range(time_horizon - task_data[task_name]["duration"] + 1)
+                for t in range(time_horizon - task_data[task_name].duration + 1)
             ])
             for task_name in task_names
         ])
@@ -152,7 +201,7 @@ def optimize_schedule(
     # Now add constraints
     # Constraint 1: Each task starts exactly once
     for task_name in task_names:
-        task_duration = task_data[task_name]["duration"]
+        task_duration = task_data[task_name].duration
         max_start = time_horizon - task_duration
         task_start_vars = [get_var(task_name, t) for t in range(max_start + 1)]
         solver.add_constraint(
@@ -167,13 +216,13 @@ def optimize_schedule(
 
         for dep_task in dependencies:
             # dep_task must finish before task_name starts
-            dep_duration = task_data[dep_task]["duration"]
+            dep_duration = task_data[dep_task].duration
 
             # Calculate start time for each task
             # start_time = sum(t * x[task,t] for all t)
             task_start = pl.lpSum([
                 t * get_var(task_name, t)
-                for t in range(time_horizon - task_data[task_name]["duration"] + 1)
+                for t in range(time_horizon - task_data[task_name].duration + 1)
             ])
 
             dep_start = pl.lpSum([
@@ -193,27 +242,23 @@ def optimize_schedule(
             total_available = resource_spec["total"]
 
             # For each time t, sum of resource usage <= available
-            for t in range(time_horizon):
-                resource_usage_at_t = 0
-
-                for task in tasks:
-                    task_name = task["name"]
-                    task_duration = task_data[task_name]["duration"]
-                    task_resources = task.get("resources", {})
-                    task_resource_req = task_resources.get(resource_name, 0)
-
-                    if task_resource_req > 0:
-                        # Task uses resources during [start, start+duration)
-                        # If task starts at s, it's active at time t if s <= t < s+duration
-                        for s in range(time_horizon - task_duration + 1):
-                            if s <= t < s + task_duration:
-                                # If task starts at s, it's using resources at t
-                                resource_usage_at_t += task_resource_req * get_var(task_name, s)
-
-                solver.add_constraint(
-                    resource_usage_at_t <= total_available,
-                    name=f"resource_{resource_name}_t{t}"
-                )
+            usage = _time_usage_matrix(
+                {
+                    task_name: task_data[task_name].resources.get(resource_name, 0)
+                    for task_name in task_names
+                },
+                task_data,
+                var_offsets,
+                len(var_list),
+                time_horizon
+            )
+            _add_capacity_constraints(
+                solver,
+                usage,
+                var_list,
+                total_available,
+                name_prefix=f"resource_{resource_name}"
+            )
 
     # Constraint 4: Additional temporal constraints
     if constraints:
@@ -224,7 +269,7 @@ def optimize_schedule(
                 # Task must finish by deadline
                 task_name = constraint["task"]
                 deadline = constraint["time"]
-                task_duration = task_data[task_name]["duration"]
+                task_duration = task_data[task_name].duration
 
                 # start + duration <= deadline
                 task_start = pl.lpSum([
@@ -240,7 +285,7 @@ def optimize_schedule(
                 # Task cannot start before release time
                 task_name = constraint["task"]
                 release_time = constraint["time"]
-                task_duration = task_data[task_name]["duration"]
+                task_duration = task_data[task_name].duration
 
                 # Only allow starts at t >= release_time
                 for t in range(min(release_time, time_horizon - task_duration + 1)):
@@ -253,26 +298,28 @@ def optimize_schedule(
                 # Maximum number of tasks in parallel
                 max_parallel = constraint["limit"]
 
-                for t in range(time_horizon):
-                    # Count tasks active at time t
-                    tasks_active_at_t = 0
-                    for task_name in task_names:
-                        task_duration = task_data[task_name]["duration"]
-                        for s in range(time_horizon - task_duration + 1):
-                            if s <= t < s + task_duration:
-                                tasks_active_at_t += get_var(task_name, s)
-
-                    solver.add_constraint(
-                        tasks_active_at_t <= max_parallel,
-                        name=f"parallel_limit_t{t}"
-                    )
+                # Count tasks active at time t
+                usage = _time_usage_matrix(
+                    {task_name: 1 for task_name in task_names},
+                    task_data,
+                    var_offsets,
+                    len(var_list),
+                    time_horizon
+                )
+                _add_capacity_constraints(
+                    solver,
+                    usage,
+                    var_list,
+                    max_parallel,
+                    name_prefix="parallel_limit"
+                )
 
     # Add makespan constraints (if minimizing makespan)
     if optimization_objective == "minimize_makespan":
         # Makespan >= end time of each task
         # Note: makespan_var was already created and objective was set earlier
         for task_name in task_names:
-            task_duration = task_data[task_name]["duration"]
+            task_duration = task_data[task_name].duration
             task_end = pl.lpSum([
                 (t + task_duration) * get_var(task_name, t)
                 for t in range(time_horizon - task_duration + 1)
@@ -315,6 +362,198 @@ def optimize_schedule(
     return result
 
 
+def _time_usage_matrix(
+    task_weights: Dict[str, float],
+    task_data: Dict[str, _TaskRecord],
+    var_offsets: Dict[str, int],
+    num_vars: int,
+    time_horizon: int
+) -> sparse.csr_matrix:
+    """
+    Build the sparse (time × start-variable) usage matrix for capacity constraints.
+
+    Entry [t, j] is the weight a task contributes at time t if it starts at
+    the time encoded by variable j, i.e. when s <= t < s + duration.
+
+    Args:
+        task_weights: Per-task usage while active (tasks with weight <= 0 are skipped)
+        task_data: Processed task data
+        var_offsets: Column index of each task's x[task, 0] variable
+        num_vars: Total number of start variables
+        time_horizon: Time horizon
+
+    Returns:
+        CSR matrix with one row per time period
+    """
+    rows, cols, data = [], [], []
+
+    for task_name, weight in task_weights.items():
+        if weight <= 0:
+            continue
+
+        duration = task_data[task_name].duration
+        starts = np.arange(time_horizon - duration + 1)
+
+        # Start s keeps the task active over [s, s + duration)
+        rows.append((starts[:, None] + np.arange(duration)).ravel())
+        cols.append(np.repeat(var_offsets[task_name] + starts, duration))
+        data.append(np.full(starts.size * duration, weight, dtype=float))
+
+    if not rows:
+        return sparse.csr_matrix((time_horizon, num_vars))
+
+    return sparse.coo_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(time_horizon, num_vars)
+    ).tocsr()
+
+
+def _add_capacity_constraints(
+    solver: PuLPSolver,
+    usage: sparse.csr_matrix,
+    var_list: List[Any],
+    limit: float,
+    name_prefix: str
+):
+    """
+    Add one "usage at t <= limit" constraint per non-empty row of a usage matrix.
+
+    Args:
+        solver: PuLP solver instance
+        usage: CSR usage matrix from _time_usage_matrix
+        var_list: Start variables in column order
+        limit: Capacity available in every time period
+        name_prefix: Constraint name prefix (suffixed with _t{t})
+    """
+    for t in range(usage.shape[0]):
+        start, end = usage.indptr[t], usage.indptr[t + 1]
+        if start == end:
+            continue  # No task can be active at t
+
+        expr = pl.LpAffineExpression(zip(
+            [var_list[j] for j in usage.indices[start:end].tolist()],
+            usage.data[start:end].tolist()
+        ))
+        solver.add_constraint(expr <= limit, name=f"{name_prefix}_t{t}")
+
+
+def _list_schedule(
+    task_names: List[str],
+    task_data: Dict[str, _TaskRecord],
+    resources: Dict[str, Dict[str, float]],
+    time_horizon: int
+) -> Optional[Dict[str, int]]:
+    """
+    Serial list scheduling with a provable-optimality check.
+
+    Tasks are placed one at a time, highest remaining-path length first, at
+    the earliest start that respects dependencies and resource capacity.
+    The schedule is returned only if its makespan equals a lower bound
+    (longest dependency chain, or total resource work / capacity), in which
+    case it is optimal and the MILP can be skipped.
+
+    Args:
+        task_names: List of task names
+        task_data: Processed task data
+        resources: Resource specifications
+        time_horizon: Time horizon
+
+    Returns:
+        Dict mapping task → start_time, or None if optimality can't be shown
+    """
+    index = {name: i for i, name in enumerate(task_names)}
+    if len(index) != len(task_names):
+        return None  # Duplicate names: let the MILP handle it
+
+    durations = [task_data[name].duration for name in task_names]
+    if not all(isinstance(d, int) for d in durations):
+        return None
+
+    predecessors = [[] for _ in task_names]
+    successors = [[] for _ in task_names]
+    for i, name in enumerate(task_names):
+        for dep in task_data[name].dependencies:
+            if dep not in index:
+                return None  # Unknown dependency: the MILP reports it
+            predecessors[i].append(index[dep])
+            successors[index[dep]].append(i)
+
+    # Topological order (Kahn); a cycle means no valid schedule
+    in_degree = [len(preds) for preds in predecessors]
+    order = [i for i, degree in enumerate(in_degree) if degree == 0]
+    for i in order:
+        for j in successors[i]:
+            in_degree[j] -= 1
+            if in_degree[j] == 0:
+                order.append(j)
+    if len(order) != len(task_names):
+        return None
+
+    # Remaining-path length (duration + longest successor chain) as priority
+    tail = [0] * len(task_names)
+    for i in reversed(order):
+        tail[i] = durations[i] + max((tail[j] for j in successors[i]), default=0)
+
+    # Lower bound: longest dependency chain, and work / capacity per resource
+    lower_bound = max(tail)
+    requirements = {}
+    for resource_name, resource_spec in (resources or {}).items():
+        capacity = resource_spec["total"]
+        req = np.array(
+            [task_data[name].resources.get(resource_name, 0) for name in task_names],
+            dtype=float
+        )
+        if not (req > 0).any():
+            continue
+        if req.max() > capacity:
+            return None  # Some task can never fit: let the MILP report infeasibility
+        requirements[resource_name] = (req, capacity)
+        work = float(req @ np.array(durations, dtype=float))
+        lower_bound = max(lower_bound, math.ceil(work / capacity - 1e-9))
+
+    profiles = {
+        resource_name: np.zeros(time_horizon, dtype=float)
+        for resource_name in requirements
+    }
+
+    # Place ready tasks by priority (longest tail first, then input order)
+    remaining_preds = [len(preds) for preds in predecessors]
+    ready = [(-tail[i], i) for i in range(len(task_names)) if remaining_preds[i] == 0]
+    heapq.heapify(ready)
+    starts = [0] * len(task_names)
+
+    while ready:
+        _, i = heapq.heappop(ready)
+        duration = durations[i]
+        start = max((starts[j] + durations[j] for j in predecessors[i]), default=0)
+
+        while start + duration <= time_horizon:
+            window = slice(start, start + duration)
+            if all(
+                (profiles[r][window] + req[i] <= capacity + 1e-9).all()
+                for r, (req, capacity) in requirements.items()
+            ):
+                break
+            start += 1
+        else:
+            return None  # Doesn't fit in the horizon
+
+        for r, (req, _) in requirements.items():
+            profiles[r][start:start + duration] += req[i]
+        starts[i] = start
+
+        for j in successors[i]:
+            remaining_preds[j] -= 1
+            if remaining_preds[j] == 0:
+                heapq.heappush(ready, (-tail[j], j))
+
+    makespan = max(start + duration for start, duration in zip(starts, durations))
+    if makespan != lower_bound:
+        return None
+
+    return {name: starts[i] for i, name in enumerate(task_names)}
+
+
 def _validate_schedule_inputs(
     tasks: List[Dict[str, Any]],
     resources: Dict[str, Dict[str, float]],
@@ -352,7 +591,7 @@ def _validate_schedule_inputs(
 def _process_task_data(
     tasks: List[Dict[str, Any]],
     mc_integration: Optional[Dict[str, Any]]
-) -> Dict[str, Dict[str, Any]]:
+) -> Dict[str, _TaskRecord]:
     """
     Process task data, incorporating Monte Carlo if provided.
 
@@ -367,12 +606,12 @@ def _process_task_data(
 
     for task in tasks:
         task_name = task["name"]
-        task_data[task_name] = {
-            "duration": task["duration"],
-            "value": task.get("value", 0),
-            "dependencies": task.get("dependencies", []),
-            "resources": task.get("resources", {})
-        }
+        task_data[task_name] = _TaskRecord(
+            duration=task["duration"],
+            value=task.get("value", 0),
+            dependencies=task.get("dependencies", []),
+            resources=task.get("resources", {})
+        )
 
     # Override durations/values with MC data if provided
     if mc_integration:
@@ -390,23 +629,23 @@ def _process_task_data(
                     # MC can provide uncertain durations
                     duration_key = f"{task_name}_duration"
                     if duration_key in mc_values:
-                        task_data[task_name]["duration"] = int(mc_values[duration_key])
+                        task_data[task_name].duration = int(mc_values[duration_key])
 
                     # MC can provide uncertain values
                     value_key = f"{task_name}_value"
                     if value_key in mc_values:
-                        task_data[task_name]["value"] = mc_values[value_key]
+                        task_data[task_name].value = mc_values[value_key]
 
             elif mode == "expected":
                 mc_values = MonteCarloIntegration.extract_expected_values(mc_output)
                 for task_name in task_data.keys():
                     duration_key = f"{task_name}_duration"
                     if duration_key in mc_values:
-                        task_data[task_name]["duration"] = int(mc_values[duration_key])
+                        task_data[task_name].duration = int(mc_values[duration_key])
 
                     value_key = f"{task_name}_value"
                     if value_key in mc_values:
-                        task_data[task_name]["value"] = mc_values[value_key]
+                        task_data[task_name].value = mc_values[value_key]
 
     return task_data
 
@@ -414,7 +653,7 @@ def _process_task_data(
 def _build_schedule_result(
     solver: PuLPSolver,
     task_names: List[str],
-    task_data: Dict[str, Dict[str, Any]],
+    task_data: Dict[str, _TaskRecord],
     time_horizon: int,
     resources: Dict[str, Dict[str, float]],
     optimization_objective: str,
@@ -459,7 +698,7 @@ def _build_schedule_result(
     # Decode schedule (find start time for each task)
     schedule = {}
     for task_name in task_names:
-        task_duration = task_data[task_name]["duration"]
+        task_duration = task_data[task_name].duration
         max_start = time_horizon - task_duration
 
         for t in range(max_start + 1):
@@ -468,12 +707,46 @@ def _build_schedule_result(
                 schedule[task_name] = t
                 break
 
-    result["schedule"] = schedule
+    result.update(_summarize_schedule(
+        schedule,
+        task_names,
+        task_data,
+        time_horizon,
+        resources,
+        optimization_objective
+    ))
+
+    return result
+
+
+def _summarize_schedule(
+    schedule: Dict[str, int],
+    task_names: List[str],
+    task_data: Dict[str, _TaskRecord],
+    time_horizon: int,
+    resources: Dict[str, Dict[str, float]],
+    optimization_objective: str
+) -> Dict[str, Any]:
+    """
+    Derive makespan, resource usage, critical path and task details from start times.
+
+    Args:
+        schedule: Task start times
+        task_names: List of task names
+        task_data: Processed task data
+        time_horizon: Time horizon
+        resources: Resource specifications
+        optimization_objective: Objective used
+
+    Returns:
+        Schedule portion of the result dictionary
+    """
+    result = {"schedule": schedule}
 
     # Calculate makespan (latest completion time)
     makespan = 0
     for task_name, start_time in schedule.items():
-        end_time = start_time + task_data[task_name]["duration"]
+        end_time = start_time + task_data[task_name].duration
         makespan = max(makespan, end_time)
 
     result["makespan"] = makespan
@@ -492,26 +765,27 @@ def _build_schedule_result(
     result["critical_path"] = critical_path
 
     # Add task details
+    critical_set = set(critical_path)
     task_details = []
     for task_name in task_names:
         start_time = schedule.get(task_name, None)
         if start_time is not None:
-            end_time = start_time + task_data[task_name]["duration"]
+            end_time = start_time + task_data[task_name].duration
             task_details.append({
                 "name": task_name,
                 "start_time": start_time,
                 "end_time": end_time,
-                "duration": task_data[task_name]["duration"],
-                "value": task_data[task_name]["value"],
-                "dependencies": task_data[task_name]["dependencies"],
-                "on_critical_path": task_name in critical_path
+                "duration": task_data[task_name].duration,
+                "value": task_data[task_name].value,
+                "dependencies": task_data[task_name].dependencies,
+                "on_critical_path": task_name in critical_set
             })
 
     result["tasks"] = task_details
 
     # Total value achieved
     if optimization_objective == "maximize_value":
-        total_value = sum(task_data[name]["value"] for name in schedule.keys())
+        total_value = sum(task_data[name].value for name in schedule.keys())
         result["total_value"] = total_value
 
     return result
@@ -519,7 +793,7 @@ def _build_schedule_result(
 
 def _calculate_resource_usage(
     schedule: Dict[str, int],
-    task_data: Dict[str, Dict[str, Any]],
+    task_data: Dict[str, _TaskRecord],
     resources: Dict[str, Dict[str, float]],
     time_horizon: int
 ) -> Dict[str, List[Dict[str, Any]]]:
@@ -546,12 +820,12 @@ def _calculate_resource_usage(
 
             # Sum usage from all active tasks at time t
             for task_name, start_time in schedule.items():
-                task_duration = task_data[task_name]["duration"]
+                task_duration = task_data[task_name].duration
                 end_time = start_time + task_duration
 
                 # Task active at time t?
                 if start_time <= t < end_time:
-                    task_resources = task_data[task_name]["resources"]
+                    task_resources = task_data[task_name].resources
                     used += task_resources.get(resource_name, 0)
 
             usage_timeline.append({
@@ -568,7 +842,7 @@ def _calculate_resource_usage(
 
 def _find_critical_path(
     schedule: Dict[str, int],
-    task_data: Dict[str, Dict[str, Any]],
+    task_data: Dict[str, _TaskRecord],
     task_names: List[str]
 ) -> List[str]:
     """
@@ -582,52 +856,51 @@ def _find_critical_path(
     Returns:
         List of task names on critical path
     """
-    # Find task with latest end time
-    latest_end = 0
-    last_task = None
+    if not schedule:
+        return []
 
-    for task_name, start_time in schedule.items():
-        end_time = start_time + task_data[task_name]["duration"]
-        if end_time > latest_end:
-            latest_end = end_time
-            last_task = task_name
+    # End time per task (index-aligned with task_names); unscheduled
+    # dependencies are treated as starting at 0
+    task_index = {name: i for i, name in enumerate(task_names)}
+    end_times = np.fromiter(
+        (schedule.get(name, 0) + task_data[name].duration for name in task_names),
+        dtype=float,
+        count=len(task_names)
+    )
 
-    if last_task is None:
-        return []
+    # Task with latest end time (first one on ties, in schedule order)
+    scheduled = np.fromiter(
+        (task_index[name] for name in schedule),
+        dtype=np.intp,
+        count=len(schedule)
+    )
+    current = int(scheduled[np.argmax(end_times[scheduled])])
 
-    # Trace backward through dependencies
+    # Trace backward through dependencies, always following the
+    # dependency that finishes latest (first one on ties)
     critical_path = []
-    current_task = last_task
-
-    while current_task:
-        critical_path.insert(0, current_task)
+    while True:
+        critical_path.append(task_names[current])
 
-        # Find predecessor on critical path
-        dependencies = task_data[current_task]["dependencies"]
+        dependencies = task_data[task_names[current]].dependencies
         if not dependencies:
             break
 
-        # Find which dependency finishes latest (is on critical path)
-        latest_pred_end = -1
-        critical_pred = None
-
-        for dep in dependencies:
-            dep_start = schedule.get(dep, 0)
-            dep_end = dep_start + task_data[dep]["duration"]
-
-            if dep_end > latest_pred_end:
-                latest_pred_end = dep_end
-                critical_pred = dep
-
-        current_task = critical_pred
+        dep_indices = np.fromiter(
+            (task_index[dep] for dep in dependencies),
+            dtype=np.intp,
+            count=len(dependencies)
+        )
+        current = int(dep_indices[np.argmax(end_times[dep_indices])])
 
+    critical_path.reverse()
     return critical_path
 
 
 def _generate_infeasibility_message(
     status: str,
     task_names: List[str],
-    task_data: Dict[str, Dict[str, Any]],
+    task_data: Dict[str, _TaskRecord],
     time_horizon: int
 ) -> str:
     """
@@ -644,7 +917,7 @@ def _generate_infeasibility_message(
     """
     if status == "infeasible":
         # Check if total duration exceeds horizon (for sequential tasks)
-        total_duration = sum(task_data[name]["duration"] for name in task_names)
+        total_duration = sum(task_data[name].duration for name in task_names)
 
         if total_duration > time_horizon:
             return (
@@ -666,7 +939,7 @@ def _generate_infeasibility_message(
 
 def _create_mc_compatible_output(
     schedule: Dict[str, int],
-    task_data: Dict[str, Dict[str, Any]],
+    task_data: Dict[str, _TaskRecord],
     makespan: int
 ) -> Dict[str, Any]:
     """
@@ -685,12 +958,12 @@ def _create_mc_compatible_output(
     for task_name, task_info in task_data.items():
         assumptions.append({
             "name": f"{task_name}_duration",
-            "value": task_info["duration"],
+            "value": task_info.duration,
             "distribution": {
                 "type": "normal",
                 "params": {
-                    "mean": task_info["duration"],
-                    "std": task_info["duration"] * 0.15  # 15% uncertainty
+                    "mean": task_info.duration,
+                    "std": task_info.duration * 0.15  # 15% uncertainty
                 }
             }
         })
@@ -9,6 +9,7 @@ Utilities for converting between different data formats:
 
 from typing import Dict, List, Any, Optional, Union
 import numpy as np
+from scipy import sparse
 
 
 class DataConverter:
@@ -209,21 +210,26 @@ class DataConverter:
     def validate_item_requirements(
         items: List[Dict[str, Any]],
         resources: Dict[str, Any]
-    ) -> bool:
+    ) -> sparse.csr_matrix:
         """
         Validate item requirements against resources.
 
+        The validated amounts are collected on the same pass, so callers get
+        the requirement matrix without walking the items again.
+
         Args:
             items: List of item requirement dicts
             resources: Resource availability dict
 
         Returns:
-            True if valid
+            CSR matrix of shape (resources, items) holding each nonzero amount
+            an item declares (rows follow resources order, columns items order)
 
         Raises:
             ValueError: If specification is invalid
         """
-        resource_names = set(resources.keys())
+        resource_index = {name: r for r, name in enumerate(resources.keys())}
+        rows, cols, values = [], [], []
 
         for i, item in enumerate(items):
             if "name" not in item:
@@ -234,10 +240,11 @@ class DataConverter:
                 if resource_name == "name":
                     continue
 
-                if resource_name not in resource_names:
+                r = resource_index.get(resource_name)
+                if r is None:
                     raise ValueError(
                         f"Item '{item['name']}' references unknown resource '{resource_name}'. "
-                        f"Available resources: {resource_names}"
+                        f"Available resources: {set(resource_index)}"
                     )
 
                 if not isinstance(amount, (int, float)):
@@ -252,7 +259,15 @@ class DataConverter:
                         f"must be non-negative"
                     )
 
-        return True
+                if amount != 0:
+                    rows.append(r)
+                    cols.append(i)
+                    values.append(amount)
+
+        return sparse.csr_matrix(
+            (np.asarray(values, dtype=np.float64), (rows, cols)),
+            shape=(len(resource_index), len(items))
+        )
 
     @staticmethod
     def validate_item_universe_consistency(
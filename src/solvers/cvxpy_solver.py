@@ -10,8 +10,10 @@ import numpy as np
 
 try:
     import cvxpy as cp
+    CLARABEL_AVAILABLE = "CLARABEL" in cp.installed_solvers()
 except ImportError:
     cp = None
+    CLARABEL_AVAILABLE = False
 
 from .base_solver import BaseSolver, OptimizationStatus, ObjectiveSense
 
@@ -85,6 +87,7 @@ class CVXPYSolver(BaseSolver):
                 )
 
             self.cvxpy_variables[name] = var
+            self.cvxpy_problem = None
 
             # Add bounds as constraints
             if name in bounds:
@@ -118,6 +121,8 @@ class CVXPYSolver(BaseSolver):
         else:
             raise ValueError(f"Invalid sense: {sense}")
 
+        self.cvxpy_problem = None
+
     def add_constraint(
         self,
         constraint: Any,
@@ -135,6 +140,7 @@ class CVXPYSolver(BaseSolver):
             The name parameter is accepted for API compatibility but not used.
         """
         self.cvxpy_constraints.append(constraint)
+        self.cvxpy_problem = None
 
     def solve(
         self,
@@ -158,11 +164,13 @@ class CVXPYSolver(BaseSolver):
         if self.cvxpy_objective is None:
             raise ValueError("Objective not set. Call set_objective first.")
 
-        # Create problem
-        self.cvxpy_problem = cp.Problem(
-            self.cvxpy_objective,
-            self.cvxpy_constraints
-        )
+        # Create problem (reused across solves until the model changes, so
+        # CVXPY can skip canonicalization when only Parameter values differ)
+        if self.cvxpy_problem is None:
+            self.cvxpy_problem = cp.Problem(
+                self.cvxpy_objective,
+                self.cvxpy_constraints
+            )
 
         # Choose solver based on problem type
         solver = self._select_solver()
@@ -212,6 +220,13 @@ class CVXPYSolver(BaseSolver):
             # Common MIP solvers: GLPK_MI, CBC, SCIP
             return None  # Auto-select
 
+        elif CLARABEL_AVAILABLE and self.cvxpy_problem is not None and self.cvxpy_problem.is_qp():
+            # LP/QP: Clarabel's interior-point method handles the quadratic
+            # objective directly and converges in far fewer iterations, to
+            # higher accuracy, than first-order SCS
+            # (OSQP is avoided: it can crash in a process where HiGHS has run)
+            return cp.CLARABEL
+
         else:
             # Continuous optimization
             # Use SCS - it's more general and handles QP, SOCP, SDP
@@ -14,6 +14,7 @@ Supported problem types:
 import time
 from typing import Dict, List, Any, Optional, Tuple
 import networkx as nx
+import numpy as np
 
 from .base_solver import BaseSolver, OptimizationStatus, ObjectiveSense
 
@@ -438,36 +439,53 @@ class NetworkXSolver(BaseSolver):
 
         return self.objective_value
 
-    def get_bottlenecks(self, tolerance: float = 0.01) -> List[Dict[str, Any]]:
+    def get_bottlenecks(
+        self,
+        tolerance: float = 0.01,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Identify bottleneck edges (at or near capacity).
 
         Args:
             tolerance: Utilization threshold (default: 99% capacity)
+            limit: Return at most this many, most utilized first (None = all)
 
         Returns:
-            List of bottleneck edge information
+            List of bottleneck edge information, highest utilization first
         """
         if not self.is_feasible():
             return []
 
-        bottlenecks = []
+        # Candidate edges and their utilization as parallel lists; only the
+        # kept ones are turned into dicts, in argsort order
+        edges = []
+        utilizations = []
         for (u, v), flow in self.solution_flows.items():
             if flow > 0:
                 capacity = self.graph[u][v].get('capacity', float('inf'))
                 if capacity < float('inf'):
                     utilization = flow / capacity
                     if utilization >= (1.0 - tolerance):
-                        bottlenecks.append({
-                            'edge': self.edge_names.get((u, v), f"{u}->{v}"),
-                            'from': u,
-                            'to': v,
-                            'capacity': capacity,
-                            'flow': flow,
-                            'utilization': utilization
-                        })
+                        edges.append((u, v, capacity, flow))
+                        utilizations.append(utilization)
 
-        return sorted(bottlenecks, key=lambda x: x['utilization'], reverse=True)
+        # Stable descending order: ties keep solution order
+        order = np.argsort(-np.asarray(utilizations, dtype=np.float64), kind="stable")
+
+        bottlenecks = []
+        for k in order[:limit].tolist():
+            u, v, capacity, flow = edges[k]
+            bottlenecks.append({
+                'edge': self.edge_names.get((u, v), f"{u}->{v}"),
+                'from': u,
+                'to': v,
+                'capacity': capacity,
+                'flow': flow,
+                'utilization': utilizations[k]
+            })
+
+        return bottlenecks
 
     def get_node_balance(self) -> Dict[str, Dict[str, float]]:
         """
@@ -479,20 +497,20 @@ class NetworkXSolver(BaseSolver):
         if not self.is_feasible():
             return {}
 
-        balance = {}
-        for node in self.graph.nodes():
-            inflow = sum(
-                self.solution_flows.get((u, node), 0)
-                for u in self.graph.predecessors(node)
-            )
-            outflow = sum(
-                self.solution_flows.get((node, v), 0)
-                for v in self.graph.successors(node)
-            )
-            balance[node] = {
-                'inflow': inflow,
-                'outflow': outflow,
-                'net': inflow - outflow
+        # One pass over the solved edges instead of a flow lookup per
+        # predecessor/successor of every node
+        nodes = self.graph.nodes()
+        inflow = dict.fromkeys(nodes, 0)
+        outflow = dict.fromkeys(nodes, 0)
+        for (u, v), flow in self.solution_flows.items():
+            outflow[u] += flow
+            inflow[v] += flow
+
+        return {
+            node: {
+                'inflow': inflow[node],
+                'outflow': outflow[node],
+                'net': inflow[node] - outflow[node]
             }
-
-        return balance
+            for node in nodes
+        }
@@ -2,16 +2,32 @@
 PuLP Solver Wrapper
 
 Wrapper for PuLP library providing linear and mixed-integer programming.
-Uses CBC solver backend (bundled with PuLP).
+Uses CBC solver backend (bundled with PuLP), or HiGHS in-process when
+highspy is installed and requested.
 """
 
 import time
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+import numpy as np
 import pulp as pl
 
 from .base_solver import BaseSolver, OptimizationStatus, ObjectiveSense
 
 
+# Solver command objects hold no per-problem state, so one instance per
+# (backend, msg, time_limit) is shared across all models in the process
+_SOLVER_COMMANDS: Dict[tuple, Any] = {}
+
+
+@lru_cache(maxsize=1)
+def _highs_available() -> bool:
+    """Check once whether the in-process HiGHS backend (highspy) is usable."""
+    # pl.HiGHS only exists from PuLP 2.8
+    highs = getattr(pl, "HiGHS", None)
+    return highs is not None and highs(msg=0).available()
+
+
 class PuLPSolver(BaseSolver):
     """
     PuLP solver wrapper for Linear Programming (LP) and Mixed-Integer Programming (MIP).
@@ -24,15 +40,22 @@ class PuLPSolver(BaseSolver):
     - Supports problems up to 10,000+ variables
     """
 
-    def __init__(self, problem_name: str = "optimization"):
+    def __init__(self, problem_name: str = "optimization", backend: str = "cbc"):
         """
         Initialize PuLP solver.
 
         Args:
             problem_name: Name for the optimization problem
+            backend: "cbc" (bundled, runs as a subprocess) or "highs"
+                    (in-process via highspy; falls back to CBC if unavailable)
         """
         super().__init__(solver_name="pulp")
+        if backend not in ("cbc", "highs"):
+            raise ValueError(
+                f"Invalid backend '{backend}'. Must be one of: ['cbc', 'highs']"
+            )
         self.problem_name = problem_name
+        self.backend = backend
         self.problem = None
         self.variables = {}
         self.constraints = {}
@@ -110,6 +133,31 @@ class PuLPSolver(BaseSolver):
         # Set objective
         self.problem += expression
 
+    def replace_objective(
+        self,
+        expression: Any,
+        sense: ObjectiveSense = ObjectiveSense.MINIMIZE
+    ):
+        """
+        Replace the objective function, keeping variables and constraints.
+
+        Args:
+            expression: PuLP linear expression
+            sense: MINIMIZE or MAXIMIZE
+
+        Raises:
+            ValueError: If problem doesn't exist (set objective first)
+        """
+        if self.problem is None:
+            raise ValueError(
+                "Problem not initialized. Call set_objective first."
+            )
+
+        self.problem.sense = (
+            pl.LpMinimize if sense == ObjectiveSense.MINIMIZE else pl.LpMaximize
+        )
+        self.problem.setObjective(expression)
+
     def add_constraint(
         self,
         constraint: Any,
@@ -137,13 +185,37 @@ class PuLPSolver(BaseSolver):
         self.problem += constraint, name
         self.constraints[name] = constraint
 
+    def add_constraints(self, constraints: Iterable[Tuple[str, Any]]):
+        """
+        Add several named constraints in one call.
+
+        Calls LpProblem.addConstraint directly instead of going through the
+        per-constraint += dispatch; names are sanitized and overlapping
+        names reported exactly as with add_constraint.
+
+        Args:
+            constraints: (name, PuLP constraint) pairs
+
+        Raises:
+            ValueError: If problem doesn't exist (set objective first)
+        """
+        if self.problem is None:
+            raise ValueError(
+                "Problem not initialized. Call set_objective first."
+            )
+
+        add = self.problem.addConstraint
+        for name, constraint in constraints:
+            add(constraint, name)
+            self.constraints[name] = constraint
+
     def solve(
         self,
         time_limit: Optional[float] = None,
         verbose: bool = False
     ) -> OptimizationStatus:
         """
-        Solve the optimization problem using CBC solver.
+        Solve the optimization problem using the configured backend.
 
         Args:
             time_limit: Maximum solving time in seconds
@@ -168,9 +240,12 @@ class PuLPSolver(BaseSolver):
         # Solve
         start_time = time.time()
         try:
-            status_code = self.problem.solve(
-                pl.PULP_CBC_CMD(msg=msg, timeLimit=time_limit)
-            )
+            # Tiny pure-binary models: enumerate instead of launching a solver
+            status_code = self._solve_by_enumeration()
+            if status_code is None:
+                status_code = self.problem.solve(
+                    self._get_solver_command(msg, time_limit)
+                )
             self.solve_time = time.time() - start_time
 
             # Map PuLP status to our standard status
@@ -188,6 +263,109 @@ class PuLPSolver(BaseSolver):
             self.status = OptimizationStatus.ERROR
             raise RuntimeError(f"Solver error: {str(e)}")
 
+    def _solve_by_enumeration(self) -> Optional[int]:
+        """
+        Solve a small pure-binary problem by checking every assignment.
+
+        With n <= 16 binary variables all 2^n assignments are evaluated as one
+        matrix product, which is much cheaper than a MILP solver round-trip.
+        Variable values, duals (0.0, as MILP solvers report) and slacks are
+        written back to the PuLP objects so the usual accessors work.
+
+        Returns:
+            PuLP status code, or None if the problem is not eligible
+        """
+        problem_vars = self.problem.variables()
+        n = len(problem_vars)
+        m = len(self.problem.constraints)
+        if n == 0 or n > 16 or (m + 1) << n > 2_000_000:
+            return None
+        if any(
+            var.cat != pl.LpInteger or var.lowBound != 0 or var.upBound != 1
+            for var in problem_vars
+        ):
+            return None
+
+        index = {var.name: j for j, var in enumerate(problem_vars)}
+
+        # All 2^n assignments, one per row
+        assignments = (
+            (np.arange(1 << n)[:, None] >> np.arange(n)) & 1
+        ).astype(float)
+
+        # Feasibility: each constraint is (a·x + constant) <sense> 0
+        feasible = np.ones(1 << n, dtype=bool)
+        constraints = list(self.problem.constraints.values())
+        if constraints:
+            coefficients = np.zeros((n, m))
+            constants = np.empty(m)
+            for i, constraint in enumerate(constraints):
+                for var, coef in constraint.items():
+                    coefficients[index[var.name], i] = coef
+                constants[i] = constraint.constant
+            lhs = assignments @ coefficients + constants
+            senses = np.array([constraint.sense for constraint in constraints])
+            tolerance = 1e-9 * np.maximum(1.0, np.abs(constants))
+            feasible &= np.where(
+                senses == pl.LpConstraintLE, lhs <= tolerance,
+                np.where(senses == pl.LpConstraintGE, lhs >= -tolerance,
+                         np.abs(lhs) <= tolerance)
+            ).all(axis=1)
+
+        if not feasible.any():
+            self.problem.status = pl.LpStatusInfeasible
+            return pl.LpStatusInfeasible
+
+        # Best feasible assignment (first one on ties)
+        objective = np.zeros(n)
+        if self.problem.objective is not None:
+            for var, coef in self.problem.objective.items():
+                objective[index[var.name]] = coef
+        scores = assignments @ objective
+        if self.problem.sense == pl.LpMaximize:
+            scores = -scores
+        scores[~feasible] = np.inf
+        best = assignments[int(np.argmin(scores))]
+
+        for j, var in enumerate(problem_vars):
+            var.varValue = float(best[j])
+            var.dj = 0.0
+        if constraints:
+            best_lhs = best @ coefficients + constants
+            for i, constraint in enumerate(constraints):
+                constraint.pi = 0.0
+                constraint.slack = -float(best_lhs[i])
+
+        self.problem.status = pl.LpStatusOptimal
+        return pl.LpStatusOptimal
+
+    def _get_solver_command(self, msg: int, time_limit: Optional[float]) -> Any:
+        """
+        Build the PuLP solver object for the configured backend.
+
+        HiGHS runs in-process, avoiding CBC's subprocess launch and
+        LP/solution file round-trip, which dominates on small models.
+
+        Args:
+            msg: Solver verbosity (0 = silent, 1 = normal)
+            time_limit: Maximum solving time in seconds
+
+        Returns:
+            PuLP solver instance
+        """
+        backend = "highs" if self.backend == "highs" and _highs_available() else "cbc"
+
+        key = (backend, msg, time_limit)
+        command = _SOLVER_COMMANDS.get(key)
+        if command is None:
+            if backend == "highs":
+                command = pl.HiGHS(msg=msg, timeLimit=time_limit)
+            else:
+                command = pl.PULP_CBC_CMD(msg=msg, timeLimit=time_limit)
+            _SOLVER_COMMANDS[key] = command
+
+        return command
+
     def _map_pulp_status(self, pulp_status: int) -> OptimizationStatus:
         """
         Map PuLP status codes to standard status.
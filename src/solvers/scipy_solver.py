@@ -42,6 +42,7 @@ class SciPySolver(BaseSolver):
         self.bounds = []     # [(lower, upper), ...] for each variable
         self.initial_guess = None
         self.objective_func = None
+        self.objective_grad = None
         self.objective_sense = ObjectiveSense.MINIMIZE
         self.constraints_list = []  # List of constraint dicts
         self.result: Optional[OptimizeResult] = None
@@ -114,7 +115,8 @@ class SciPySolver(BaseSolver):
     def set_objective(
         self,
         expression: Callable[[np.ndarray], float],
-        sense: ObjectiveSense = ObjectiveSense.MINIMIZE
+        sense: ObjectiveSense = ObjectiveSense.MINIMIZE,
+        gradient: Optional[Callable[[np.ndarray], np.ndarray]] = None
     ):
         """
         Set the objective function.
@@ -122,6 +124,8 @@ class SciPySolver(BaseSolver):
         Args:
             expression: Callable that takes variable array and returns float
             sense: MINIMIZE or MAXIMIZE
+            gradient: Optional callable returning the objective gradient
+                     (avoids finite-difference Jacobian estimation)
 
         Example:
             def objective(x):
@@ -129,6 +133,7 @@ class SciPySolver(BaseSolver):
             solver.set_objective(objective, ObjectiveSense.MINIMIZE)
         """
         self.objective_func = expression
+        self.objective_grad = gradient
         self.objective_sense = sense
 
     def add_constraint(
@@ -187,8 +192,13 @@ class SciPySolver(BaseSolver):
         # Prepare objective (negate if maximizing)
         if self.objective_sense == ObjectiveSense.MAXIMIZE:
             objective = lambda x: -self.objective_func(x)
+            gradient = (
+                (lambda x: -self.objective_grad(x))
+                if self.objective_grad is not None else None
+            )
         else:
             objective = self.objective_func
+            gradient = self.objective_grad
 
         # Prepare options
         options = {
@@ -204,6 +214,7 @@ class SciPySolver(BaseSolver):
                 fun=objective,
                 x0=self.initial_guess,
                 method=self.method,
+                jac=gradient,
                 bounds=self.bounds if self.bounds else None,
                 constraints=self.constraints_list if self.constraints_list else None,
                 options=options
@@ -381,6 +392,7 @@ class SciPySolver(BaseSolver):
         self.bounds = []
         self.initial_guess = None
         self.objective_func = None
+        self.objective_grad = None
         self.constraints_list = []
         self.result = None
 
@@ -0,0 +1,42 @@
+"""Regression tests for optimize_allocation."""
+
+import random
+
+import pytest
+
+from src.api.allocation import optimize_allocation
+from src.solvers.pulp_solver import _highs_available
+
+
+@pytest.mark.skipif(not _highs_available(), reason="highspy not installed")
+@pytest.mark.parametrize("seed", range(10))
+def test_highs_selection_matches_objective(seed):
+    # 60 binaries: past the enumeration path, so HiGHS solves the model and
+    # reports selections within tolerance (e.g. 0.9999999999999969)
+    rnd = random.Random(seed)
+    names = [f"item_{j}" for j in range(60)]
+    values = {name: rnd.randint(1, 100) for name in names}
+    resources = {name: {"total": rnd.randint(200, 600)} for name in ("a", "b", "c")}
+    item_requirements = [
+        {"name": name, **{resource: rnd.randint(1, 30) for resource in resources}}
+        for name in names
+    ]
+
+    result = optimize_allocation(
+        objective={
+            "sense": "maximize",
+            "items": [{"name": name, "value": value} for name, value in values.items()]
+        },
+        resources=resources,
+        item_requirements=item_requirements,
+        solver_options={"engine": "highs"}
+    )
+
+    assert result["status"] == "optimal"
+    assert set(result["allocation"].values()) <= {0, 1}
+    selected = [name for name in names if result["allocation"][name] == 1]
+    assert result["selected_items"] == selected
+    assert sum(values[name] for name in selected) == pytest.approx(result["objective_value"])
+    for resource, usage in result["resource_usage"].items():
+        used = sum(item[resource] for item in item_requirements if item["name"] in selected)
+        assert usage["used"] == pytest.approx(used)